@@ -20,9 +20,11 @@ export default async function handler(req: VercelRequest, res: VercelResponse) {
 
   try {
     if (req.method === 'GET') {
-      // Получить список всех игр
-      const games = await redis.get<GeneratedGame[]>(STORAGE_KEY);
-      return res.status(200).json(games || []);
+      // Получить список всех игр: в Redis уже лежит готовый JSON (его пишет только redis.set),
+      // поэтому отдаём строку как есть, без JSON.parse + повторного JSON.stringify
+      const raw = await redis.getRaw(STORAGE_KEY);
+      res.setHeader('Content-Type', 'application/json; charset=utf-8');
+      return res.status(200).send(raw ?? '[]');
     }
 
     if (req.method === 'POST') {
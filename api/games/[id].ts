@@ -59,13 +59,15 @@ export default async function handler(req: VercelRequest, res: VercelResponse) {
     if (req.method === 'DELETE') {
       // Удалить игру
       const games = (await redis.get<GeneratedGame[]>(STORAGE_KEY)) || [];
-      const filtered = games.filter((g) => g.id !== id);
+      const existingIndex = games.findIndex((g) => g.id === id);
 
-      if (games.length === filtered.length) {
+      if (existingIndex < 0) {
         return res.status(404).json({ error: 'Game not found' });
       }
 
-      await redis.set(STORAGE_KEY, filtered);
+      // Удаляем на месте, без промежуточной копии всего списка
+      games.splice(existingIndex, 1);
+      await redis.set(STORAGE_KEY, games);
       return res.status(200).json({ success: true });
     }
 
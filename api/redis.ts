@@ -39,6 +39,12 @@ export const redis = {
     }
   },
   
+  // Сырой JSON как он лежит в Redis — для ответов, которым не нужно разбирать значение
+  async getRaw(key: string): Promise<string | null> {
+    const client = getRedisClient();
+    return (await client.get(key)) || null;
+  },
+
   async set(key: string, value: unknown): Promise<void> {
     const client = getRedisClient();
     await client.set(key, JSON.stringify(value));
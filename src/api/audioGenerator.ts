@@ -1,5 +1,10 @@
 const SAMPLE_RATE = 22050;
 const MAX_AMPLITUDE = 32767; // 16-bit signed
+// WAV хранит сэмплы в little-endian; на таких платформах PCM можно копировать в буфер целиком
+const IS_LITTLE_ENDIAN = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+
+// C, D, E, F, G, A, B, C5
+const NOTE_FREQS: readonly number[] = [261.63, 293.66, 329.63, 349.23, 392.0, 440.0, 493.88, 523.25];
 
 export type AudioKind = 'music' | 'sfx';
 
@@ -18,36 +23,25 @@ export interface GeneratedAudioFile {
   kind: AudioKind;
   filename: string;
   mimeType: string;
-  blob: Blob;
+  bytes: Uint8Array;
 }
 
 class MusicGenerator {
-  private generateSquareWave(freq: number, duration: number, sampleRate: number = SAMPLE_RATE): Int16Array {
-    const sampleCount = Math.floor(sampleRate * duration);
-    const samples = new Int16Array(sampleCount);
-
+  private writeSquareWave(
+    target: Int16Array,
+    offset: number,
+    freq: number,
+    sampleCount: number,
+    sampleRate: number = SAMPLE_RATE,
+  ): void {
     for (let i = 0; i < sampleCount; i++) {
       const t = i / sampleRate;
       const value = Math.sign(Math.sin(2 * Math.PI * freq * t));
-      samples[i] = value * MAX_AMPLITUDE * 0.3;
+      target[offset + i] = value * MAX_AMPLITUDE * 0.3;
     }
-
-    return samples;
   }
 
   private generate8BitSequence(numNotes: number, noteDuration: number): Int16Array {
-    const noteFreqs: Record<string, number> = {
-      C: 261.63,
-      D: 293.66,
-      E: 329.63,
-      F: 349.23,
-      G: 392.0,
-      A: 440.0,
-      B: 493.88,
-      C5: 523.25,
-    };
-    const noteNames = Object.keys(noteFreqs);
-
     // Roughly match Python logic: sequence of notes with small gaps
     const silenceDuration = 0.05;
     const noteSamples = Math.floor(SAMPLE_RATE * noteDuration);
@@ -57,11 +51,9 @@ class MusicGenerator {
 
     let offset = 0;
     for (let i = 0; i < numNotes; i++) {
-      const name = noteNames[Math.floor(Math.random() * noteNames.length)];
-      const freq = noteFreqs[name];
-      const wave = this.generateSquareWave(freq, noteDuration);
-
-      result.set(wave, offset);
+      const freq = NOTE_FREQS[Math.floor(Math.random() * NOTE_FREQS.length)];
+      // Пишем ноту сразу в итоговый буфер, без промежуточного массива на каждую ноту
+      this.writeSquareWave(result, offset, freq, noteSamples);
       offset += noteSamples;
 
       // silence
@@ -98,9 +90,9 @@ class MusicGenerator {
 
 /**
  * Very small WAV encoder for 16‑bit mono PCM.
- * Returns a Blob that can be used as an <audio> source.
+ * Returns the raw WAV file bytes, ready to be base64-encoded into a data URL.
  */
-function pcm16ToWavBlob(pcm: Int16Array, sampleRate: number = SAMPLE_RATE): Blob {
+function pcm16ToWav(pcm: Int16Array, sampleRate: number = SAMPLE_RATE): Uint8Array {
   const bytesPerSample = 2;
   const numChannels = 1;
   const blockAlign = numChannels * bytesPerSample;
@@ -144,11 +136,15 @@ function pcm16ToWavBlob(pcm: Int16Array, sampleRate: number = SAMPLE_RATE): Blob
   offset += 4;
 
   // PCM data
-  for (let i = 0; i < pcm.length; i++, offset += 2) {
-    view.setInt16(offset, pcm[i], true);
+  if (IS_LITTLE_ENDIAN) {
+    new Int16Array(buffer, offset, pcm.length).set(pcm);
+  } else {
+    for (let i = 0; i < pcm.length; i++, offset += 2) {
+      view.setInt16(offset, pcm[i], true);
+    }
   }
 
-  return new Blob([buffer], { type: 'audio/wav' });
+  return new Uint8Array(buffer);
 }
 
 function writeString(view: DataView, offset: number, text: string): void {
@@ -159,7 +155,7 @@ function writeString(view: DataView, offset: number, text: string): void {
 
 /**
  * High-level helper that roughly повторяет контракт Python‑эндпоинта:
- * принимает массивы music/sound_effects и возвращает список Blob‑файлов.
+ * принимает массивы music/sound_effects и возвращает список WAV‑файлов в виде байтов.
  */
 export async function generateAudioAssets(
   request: AudioGenerationRequest,
@@ -174,24 +170,24 @@ export async function generateAudioAssets(
     if (!item.query || !item.output) continue;
     const duration = typeof item.duration === 'number' ? item.duration : 256;
     const pcm = mg.generateMusicBytes(duration);
-    const blob = pcm16ToWavBlob(pcm);
+    const bytes = pcm16ToWav(pcm);
     result.push({
       kind: 'music',
       filename: item.output.endsWith('.wav') ? item.output : `${item.output}.wav`,
       mimeType: 'audio/wav',
-      blob,
+      bytes,
     });
   }
 
   for (const item of sfxItems) {
     if (!item.query || !item.output) continue;
     const pcm = mg.generateSfxBytes(item.query);
-    const blob = pcm16ToWavBlob(pcm);
+    const bytes = pcm16ToWav(pcm);
     result.push({
       kind: 'sfx',
       filename: item.output.endsWith('.wav') ? item.output : `${item.output}.wav`,
       mimeType: 'audio/wav',
-      blob,
+      bytes,
     });
   }
 
@@ -11,6 +11,29 @@ import type {
 import { GameTemplate } from '@/types';
 import { generateAudioAssets } from './audioGenerator';
 
+// Подписи шаблонов и сложностей для промпта — общие для всех вызовов, собираем один раз
+const PROMPT_TEMPLATE_NAMES: Record<GameTemplate, string> = {
+  [GameTemplate.PLATFORMER]: 'платформер',
+  [GameTemplate.ARCADE]: 'аркада',
+  [GameTemplate.PUZZLE]: 'головоломка',
+  [GameTemplate.TOWER_DEFENSE]: 'башенная оборона',
+  [GameTemplate.VERTICAL_STANDARD]: 'вертикальный каркас',
+  [GameTemplate.ROGUELIKE]: 'roguelike выживание (survivor-like с автоатаками)',
+};
+
+const PROMPT_DIFFICULTY_NAMES: Record<string, string> = {
+  easy: 'легкая',
+  medium: 'средняя',
+  hard: 'сложная',
+};
+
+// Сколько запросов на генерацию SVG-спрайтов отправляем параллельно
+const SPRITE_SVG_CONCURRENCY = 4;
+
+// Размер куска при переводе байтов в base64: ниже лимита аргументов String.fromCharCode
+// и кратен 3, чтобы base64 отдельных кусков склеивался без паддинга посередине
+const BINARY_CHUNK_SIZE = 0x6000;
+
 interface ChatCompletionOptions {
   temperature?: number;
   maxTokens?: number;
@@ -88,21 +111,6 @@ export class ChatGPTAPI {
   }
 
   private buildPrompt(config: GameConfig): string {
-    const templateNames: Record<GameTemplate, string> = {
-      [GameTemplate.PLATFORMER]: 'платформер',
-      [GameTemplate.ARCADE]: 'аркада',
-      [GameTemplate.PUZZLE]: 'головоломка',
-      [GameTemplate.TOWER_DEFENSE]: 'башенная оборона',
-      [GameTemplate.VERTICAL_STANDARD]: 'вертикальный каркас',
-      [GameTemplate.ROGUELIKE]: 'roguelike выживание (survivor-like с автоатаками)',
-    };
-
-    const difficultyNames: Record<string, string> = {
-      easy: 'легкая',
-      medium: 'средняя',
-      hard: 'сложная',
-    };
-
     const extra = this.getTemplateSpecificInstructions(config);
     const userPromptRaw =
       config.template === GameTemplate.PUZZLE
@@ -113,7 +121,7 @@ export class ChatGPTAPI {
     const userPrompt =
       typeof userPromptRaw === 'string' ? userPromptRaw.trim().slice(0, 1200) : '';
 
-    let prompt = `Создай игру типа "${templateNames[config.template]}" со сложностью "${difficultyNames[config.difficulty]}".
+    let prompt = `Создай игру типа "${PROMPT_TEMPLATE_NAMES[config.template]}" со сложностью "${PROMPT_DIFFICULTY_NAMES[config.difficulty]}".
 
 Параметры: ${JSON.stringify(config.params, null, 2)}
 
@@ -164,7 +172,7 @@ ${userPrompt}`;
     }
 
     const modelName = options.model ?? this.defaultModel;
-    const canUseResponseFormat = Boolean(
+    let useResponseFormat = Boolean(
       options.responseFormat && this.supportsResponseFormat(modelName),
     );
 
@@ -175,36 +183,40 @@ ${userPrompt}`;
       max_tokens: options.maxTokens ?? 2000,
     };
 
-    if (canUseResponseFormat && options.responseFormat) {
-      payload.response_format = options.responseFormat;
-    }
+    // Повтор без response_format делаем в цикле: ключ и payload уже собраны, пересобирать их не нужно
+    let response: Response;
+    while (true) {
+      if (useResponseFormat && options.responseFormat) {
+        payload.response_format = options.responseFormat;
+      } else {
+        delete payload.response_format;
+      }
 
-    const response = await fetch(this.baseUrl, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        Authorization: `Bearer ${this.getApiKey()}`,
-      },
-      body: JSON.stringify(payload),
-    });
+      response = await fetch(this.baseUrl, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          Authorization: `Bearer ${apiKey}`,
+        },
+        body: JSON.stringify(payload),
+      });
+
+      if (response.ok) {
+        break;
+      }
 
-    if (!response.ok) {
       let message = 'Unknown error';
       try {
         const error = await response.json();
         message = error.error?.message || message;
-        if (canUseResponseFormat &&
-          options.responseFormat &&
-          typeof message === 'string' &&
-          message.toLowerCase().includes('response_format')
-        ) {
-          console.warn('Модель не поддерживает response_format, повторяем запрос без него.');
-          const { responseFormat, ...rest } = options;
-          return this.callChatCompletion(messages, rest);
-        }
       } catch {
         // no-op
       }
+      if (useResponseFormat && typeof message === 'string' && message.toLowerCase().includes('response_format')) {
+        console.warn('Модель не поддерживает response_format, повторяем запрос без него.');
+        useResponseFormat = false;
+        continue;
+      }
       throw new Error(`API Error: ${message}`);
     }
 
@@ -228,8 +240,10 @@ ${userPrompt}`;
   }
 
   private extractJsonBlock(text: string): string | null {
-    const match = text.match(/\{[\s\S]*\}/);
-    return match ? match[0] : null;
+    // То же, что жадный /\{[\s\S]*\}/, но двумя нативными поисками без прохода regex с откатом
+    const start = text.indexOf('{');
+    const end = text.lastIndexOf('}');
+    return start >= 0 && end > start ? text.slice(start, end + 1) : null;
   }
 
   private extractSvg(text: string): string | null {
@@ -307,33 +321,49 @@ ${userPrompt}`;
         spriteIds: plan.sprites.map((s) => s.id),
       });
 
-      const spriteSheets: SpriteAsset[] = [];
-      for (let i = 0; i < plan.sprites.length; i++) {
-        const entry = plan.sprites[i];
-        console.info(`[SpriteGen] Генерируем SVG для спрайта ${i + 1}/${plan.sprites.length}: ${entry.id} (${entry.role})`);
-        
-        try {
-          const svg = await this.generateSpriteSvg(entry, plan.styleGuide, gameData);
-          if (!svg) {
-            console.warn(`[SpriteGen] SVG для ${entry.id} не был сгенерирован (вернулся null)`);
-            continue;
+      // Запросы SVG независимы, поэтому держим несколько в полёте одновременно.
+      // Результаты раскладываем по индексу плана, чтобы порядок спрайтов не зависел от порядка ответов
+      const entries = plan.sprites;
+      const styleGuide = plan.styleGuide;
+      const generated: (SpriteAsset | null)[] = new Array(entries.length).fill(null);
+      // Наличие hero-спрайта отмечаем прямо в цикле генерации, а не повторным проходом по результатам
+      let hasHeroSprite = false;
+      let nextIndex = 0;
+      const runWorker = async (): Promise<void> => {
+        while (nextIndex < entries.length) {
+          const i = nextIndex++;
+          const entry = entries[i];
+          console.info(`[SpriteGen] Генерируем SVG для спрайта ${i + 1}/${entries.length}: ${entry.id} (${entry.role})`);
+
+          try {
+            const svg = await this.generateSpriteSvg(entry, styleGuide, gameData);
+            if (!svg) {
+              console.warn(`[SpriteGen] SVG для ${entry.id} не был сгенерирован (вернулся null)`);
+              continue;
+            }
+
+            generated[i] = {
+              meta: entry,
+              svg,
+              viewBox: this.extractViewBox(svg, entry.size),
+            };
+            if (entry.role === 'hero') {
+              hasHeroSprite = true;
+            }
+            console.info(`[SpriteGen] SVG для ${entry.id} успешно сгенерирован (${svg.length} символов)`);
+          } catch (spriteError) {
+            console.error(`[SpriteGen] Ошибка при генерации SVG для ${entry.id}:`, spriteError);
+            // Продолжаем генерацию остальных спрайтов даже если один не удался
           }
-
-          spriteSheets.push({
-            meta: entry,
-            svg,
-            viewBox: this.extractViewBox(svg, entry.size),
-          });
-          console.info(`[SpriteGen] SVG для ${entry.id} успешно сгенерирован (${svg.length} символов)`);
-        } catch (spriteError) {
-          console.error(`[SpriteGen] Ошибка при генерации SVG для ${entry.id}:`, spriteError);
-          // Продолжаем генерацию остальных спрайтов даже если один не удался
         }
-      }
+      };
+      const workerCount = Math.min(SPRITE_SVG_CONCURRENCY, entries.length);
+      await Promise.all(Array.from({ length: workerCount }, runWorker));
+
+      const spriteSheets = generated.filter((sheet): sheet is SpriteAsset => sheet !== null);
 
       // Если герой описан в плане, но ни один hero-спрайт не удалось получить от LLM — создаём простой fallback SVG
       const heroMeta = plan.sprites.find((s) => s.role === 'hero');
-      const hasHeroSprite = spriteSheets.some((sheet) => sheet.meta.role === 'hero');
       if (heroMeta && !hasHeroSprite) {
         const fallbackSvg = this.buildFallbackHeroSvg(heroMeta, plan.styleGuide);
         spriteSheets.push({
@@ -403,7 +433,9 @@ ${userPrompt}`;
         { id: 'explosion', query: 'explosion', label: 'Взрыв / мощный эффект' },
       ];
 
-      const audioBlobs = await generateAudioAssets({
+      const sfxLabelById = new Map(sfxQueries.map((s) => [s.id, s.label]));
+
+      const audioFiles = await generateAudioAssets({
         music: [
           {
             query: musicQueryBase,
@@ -417,35 +449,36 @@ ${userPrompt}`;
         })),
       });
 
-      if (!audioBlobs.length) {
+      if (!audioFiles.length) {
         console.info('[AudioGen] Аудио-ассеты не были сгенерированы.');
         return;
       }
 
-      const files: GameAudioFile[] = await Promise.all(
-        audioBlobs.map(async (file, index) => {
-          const arrayBuffer = await file.blob.arrayBuffer();
-          const bytes = new Uint8Array(arrayBuffer);
-          let binary = '';
-          for (let i = 0; i < bytes.length; i++) {
-            binary += String.fromCharCode(bytes[i]);
+      // WAV-байты берём напрямую из генератора: без обёртки в Blob и асинхронного чтения обратно
+      const files: GameAudioFile[] = audioFiles.map((file, index) => {
+        const bytes = file.bytes;
+        // Кодируем кусками и склеиваем уже готовый base64 — без промежуточной бинарной строки во весь файл
+        const chunks: string[] = [];
+        if (typeof btoa !== 'undefined') {
+          for (let i = 0; i < bytes.length; i += BINARY_CHUNK_SIZE) {
+            chunks.push(btoa(String.fromCharCode(...bytes.subarray(i, i + BINARY_CHUNK_SIZE))));
           }
-          const base64 = typeof btoa !== 'undefined' ? btoa(binary) : '';
-          const dataUrl = base64 ? `data:${file.mimeType};base64,${base64}` : '';
-
-          const matchedSfx = sfxQueries.find((s) => s.id === file.filename.replace(/\.wav$/i, ''));
-          const isMusic = file.kind === 'music';
-
-          return {
-            id: `${file.kind}-${index}`,
-            kind: file.kind,
-            label: isMusic ? 'Основная тема' : matchedSfx?.label || file.filename,
-            fileName: file.filename,
-            mimeType: file.mimeType,
-            dataUrl,
-          };
-        }),
-      );
+        }
+        const base64 = chunks.join('');
+        const dataUrl = base64 ? `data:${file.mimeType};base64,${base64}` : '';
+
+        const sfxLabel = sfxLabelById.get(file.filename.replace(/\.wav$/i, ''));
+        const isMusic = file.kind === 'music';
+
+        return {
+          id: `${file.kind}-${index}`,
+          kind: file.kind,
+          label: isMusic ? 'Основная тема' : sfxLabel || file.filename,
+          fileName: file.filename,
+          mimeType: file.mimeType,
+          dataUrl,
+        };
+      });
 
       const audioPack: GeneratedGameAudio = {
         pipeline: '8bit-procedural',
@@ -511,7 +544,7 @@ ${userPrompt}`;
 
       const jsonPayload = this.extractJsonBlock(content);
       if (!jsonPayload) {
-        console.warn('План спрайтов: JSON блок не найден, см. превью в debug логах.');
+        console.warn('План спрайтов: JSON блок не найден, превью ответа пишется в debug-лог только в dev-сборке.');
         this.debugSpritePayload('plan.no-json', content);
         return null;
       }
@@ -593,7 +626,7 @@ ${userPrompt}`;
         
         return plan;
       } catch (parseError) {
-        console.warn('План спрайтов: ошибка парсинга JSON, см. превью в debug логах.');
+        console.warn('План спрайтов: ошибка парсинга JSON, превью ответа пишется в debug-лог только в dev-сборке.');
         this.debugSpritePayload('plan.invalid-json', jsonPayload);
         throw parseError;
       }
@@ -609,9 +642,10 @@ ${userPrompt}`;
       // Убираем громоздкий блок вариаций, чтобы не засорять промпт для художника
       delete (mechanicsCloned as Record<string, unknown>)['gameVariation'];
     }
-    const mechanicsSummary = JSON.stringify(mechanicsCloned, null, 2);
-    const visualsSummary = JSON.stringify(gameData.visuals ?? {}, null, 2);
-    const paramsSummary = JSON.stringify(config.params ?? {}, null, 2);
+    // Компактный JSON без отступов: модели они не нужны, а токены промпта оплачиваются
+    const mechanicsSummary = JSON.stringify(mechanicsCloned);
+    const visualsSummary = JSON.stringify(gameData.visuals ?? {});
+    const paramsSummary = JSON.stringify(config.params ?? {});
 
     return `Нужно продумать 16-битный SVG набор спрайтов для мобильной игры с детализированными спрайтами в разрешении около 64×64 пикселей (не меньше 64 по меньшей стороне).
 
@@ -713,7 +747,7 @@ ${this.getTemplateSpecificSpriteRequirements(config)}
 
       const svg = this.extractSvg(content);
       if (!svg) {
-        console.warn(`[SpriteGen] SVG для спрайта ${entry.id}: блок <svg> не найден в ответе, см. превью в debug логах.`);
+        console.warn(`[SpriteGen] SVG для спрайта ${entry.id}: блок <svg> не найден в ответе, превью ответа пишется в debug-лог только в dev-сборке.`);
         this.debugSpritePayload(`svg.${entry.id}.no-svg`, content);
         return null;
       }
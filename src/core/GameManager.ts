@@ -9,6 +9,15 @@ import { TowerDefenseScene } from '@/scenes/templates/TowerDefenseScene';
 import { VerticalStandardScene } from '@/scenes/templates/VerticalStandardScene';
 import { RoguelikeScene } from '@/scenes/templates/RoguelikeScene';
 
+const SCENE_BY_TEMPLATE: Record<GameTemplate, typeof BaseGameScene> = {
+  [GameTemplate.PLATFORMER]: PlatformerScene,
+  [GameTemplate.ARCADE]: ArcadeScene,
+  [GameTemplate.PUZZLE]: PuzzleScene,
+  [GameTemplate.TOWER_DEFENSE]: TowerDefenseScene,
+  [GameTemplate.VERTICAL_STANDARD]: VerticalStandardScene,
+  [GameTemplate.ROGUELIKE]: RoguelikeScene,
+};
+
 export class GameManager {
   private phaserGame: Phaser.Game | null = null;
   private currentGame: GeneratedGame | null = null;
@@ -79,22 +88,11 @@ export class GameManager {
   }
 
   private getSceneClassForTemplate(template: GameTemplate): typeof BaseGameScene {
-    switch (template) {
-      case GameTemplate.PLATFORMER:
-        return PlatformerScene;
-      case GameTemplate.ARCADE:
-        return ArcadeScene;
-      case GameTemplate.PUZZLE:
-        return PuzzleScene;
-      case GameTemplate.TOWER_DEFENSE:
-        return TowerDefenseScene;
-      case GameTemplate.VERTICAL_STANDARD:
-        return VerticalStandardScene;
-      case GameTemplate.ROGUELIKE:
-        return RoguelikeScene;
-      default:
-        throw new Error(`Unknown template: ${template}`);
+    const sceneClass = SCENE_BY_TEMPLATE[template];
+    if (!sceneClass) {
+      throw new Error(`Unknown template: ${template}`);
     }
+    return sceneClass;
   }
 
   updateScore(points: number): void {
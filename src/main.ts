@@ -5,6 +5,7 @@ import { GameStorage } from './storage/GameStorage';
 
 let mainScreen: MainScreen;
 let gameManager: GameManager;
+let currentGame: GeneratedGame | null = null;
 
 function renderMainScreen(): void {
   mainScreen = new MainScreen('app');
@@ -25,8 +26,10 @@ function init(): void {
 
   // Обработчик завершения игры
   gameManager.setOnGameEnd(async (score, rewards) => {
-    const game = await GameStorage.getGame((window as unknown as { currentGameId?: string }).currentGameId || '');
-    if (game) {
+    // Игра уже загружена при запуске — не запрашиваем её повторно перед сохранением результата
+    const game = currentGame;
+    // Если результат ничего не поменял (тот же счёт, без рекорда и наград), не гоняем игру целиком на сервер
+    if (game && (game.score !== score || score > game.highScore || rewards !== 0)) {
       game.score = score;
       if (score > game.highScore) {
         game.highScore = score;
@@ -41,8 +44,7 @@ function init(): void {
 }
 
 function startGame(game: GeneratedGame): void {
-  // Сохраняем ID текущей игры
-  (window as unknown as { currentGameId?: string }).currentGameId = game.id;
+  currentGame = game;
 
   // Очищаем контейнер
   const app = document.getElementById('app');
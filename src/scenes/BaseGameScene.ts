@@ -11,6 +11,14 @@ import type {
   GameAudioFile,
 } from '@/types';
 
+const VARIATION_PACES: ReadonlySet<string> = new Set(['slow', 'normal', 'fast']);
+const MUTATOR_TYPES: ReadonlySet<string> = new Set([
+  'scoreMultiplier',
+  'timeScale',
+  'oneHitDeath',
+  'invertHorizontalControls',
+]);
+
 export abstract class BaseGameScene extends Phaser.Scene {
   protected gameData!: GeneratedGame;
   protected score: number = 0;
@@ -29,6 +37,7 @@ export abstract class BaseGameScene extends Phaser.Scene {
   private llmTexturesByRole = new Map<SpriteRole, string[]>();
   private llmMetaByTextureKey = new Map<string, SpritePlanEntry>();
   private llmMissingTextureDebug = new Set<string>();
+  private screenOverlay?: Phaser.GameObjects.Rectangle;
 
   constructor(config: string | Phaser.Types.Scenes.SettingsConfig = 'game') {
     super(config);
@@ -204,31 +213,55 @@ export abstract class BaseGameScene extends Phaser.Scene {
       this.backgroundMusic = undefined;
     }
 
-    if (this.endEventDispatched && !force) {
+    // Событие уходит один раз; повторный вызов без force после завершения игры ничего не делает
+    if (this.endEventDispatched || (this.gameEnded && !force)) {
       return;
     }
 
-    if (!this.gameEnded) {
-      this.gameEnded = true;
-    } else if (!force) {
-      return;
+    this.gameEnded = true;
+    this.endEventDispatched = true;
+    this.events.emit('gameEnd', this.score);
+    this.scene.stop();
+  }
+
+  /**
+   * Полноэкранное затемнение под итоговые окна.
+   * Создаётся один раз на сцену, дальше переиспользуется и подгоняется под resize.
+   */
+  protected showScreenOverlay(alpha: number, depth: number = 10): Phaser.GameObjects.Rectangle {
+    if (!this.screenOverlay) {
+      this.scale.on(Phaser.Scale.Events.RESIZE, this.resizeScreenOverlay, this);
+      this.events.once(Phaser.Scenes.Events.SHUTDOWN, () => {
+        this.scale.off(Phaser.Scale.Events.RESIZE, this.resizeScreenOverlay, this);
+        this.screenOverlay = undefined;
+      });
     }
 
-    if (this.endEventDispatched) {
-      return;
+    if (!this.screenOverlay || !this.screenOverlay.scene) {
+      this.screenOverlay = this.add
+        .rectangle(0, 0, this.scale.width, this.scale.height, 0x000000, alpha)
+        .setOrigin(0, 0)
+        .setScrollFactor(0);
     }
 
-    this.endEventDispatched = true;
-    this.events.emit('gameEnd', this.score);
-    this.scene.stop();
+    return this.screenOverlay
+      .setSize(this.scale.width, this.scale.height)
+      .setFillStyle(0x000000, alpha)
+      .setDepth(depth)
+      .setVisible(true);
+  }
+
+  private resizeScreenOverlay(gameSize: Phaser.Structs.Size): void {
+    if (this.screenOverlay?.scene) {
+      this.screenOverlay.setSize(gameSize.width, gameSize.height);
+    }
   }
 
   protected showGameOver(score: number): void {
     const centerX = this.scale.width / 2;
     const centerY = this.scale.height / 2;
 
-    const overlay = this.add.rectangle(centerX, centerY, this.scale.width, this.scale.height, 0x000000, 0.8);
-    overlay.setScrollFactor(0);
+    this.showScreenOverlay(0.8);
 
     const gameOverText = this.add.text(centerX, centerY - 60, 'Игра окончена!', {
       fontSize: '36px',
@@ -237,6 +270,7 @@ export abstract class BaseGameScene extends Phaser.Scene {
     });
     gameOverText.setOrigin(0.5);
     gameOverText.setScrollFactor(0);
+    gameOverText.setDepth(11);
 
     const scoreText = this.add.text(centerX, centerY, `Ваш счет: ${score}`, {
       fontSize: '28px',
@@ -245,6 +279,7 @@ export abstract class BaseGameScene extends Phaser.Scene {
     });
     scoreText.setOrigin(0.5);
     scoreText.setScrollFactor(0);
+    scoreText.setDepth(11);
 
     const continueButton = this.add
       .text(centerX, centerY + 60, 'Продолжить', {
@@ -254,7 +289,8 @@ export abstract class BaseGameScene extends Phaser.Scene {
       })
       .setOrigin(0.5)
       .setInteractive({ useHandCursor: true })
-      .setScrollFactor(0);
+      .setScrollFactor(0)
+      .setDepth(11);
 
     continueButton.on('pointerdown', () => {
       this.endGame(true);
@@ -366,9 +402,8 @@ export abstract class BaseGameScene extends Phaser.Scene {
     const safeMood =
       typeof source.mood === 'string' && source.mood.trim().length > 0 ? source.mood.trim() : undefined;
 
-    const allowedPace = new Set(['slow', 'normal', 'fast']);
     const hasValidPace =
-      typeof source.pace === 'string' && allowedPace.has(source.pace);
+      typeof source.pace === 'string' && VARIATION_PACES.has(source.pace);
     const pace = (hasValidPace ? source.pace : 'normal') as GameVariationProfile['pace'];
 
     const riskRaw =
@@ -392,13 +427,7 @@ export abstract class BaseGameScene extends Phaser.Scene {
                 ? m.description.trim()
                 : name;
             const type = m.type;
-            const allowedTypes: GlobalMutator['type'][] = [
-              'scoreMultiplier',
-              'timeScale',
-              'oneHitDeath',
-              'invertHorizontalControls',
-            ];
-            const isValidType = allowedTypes.includes(type);
+            const isValidType = MUTATOR_TYPES.has(type);
             if (!isValidType) {
               return undefined;
             }
@@ -523,9 +552,13 @@ export abstract class BaseGameScene extends Phaser.Scene {
         this.llmTexturesById.set(sheet.meta.id, textureKey);
         this.llmMetaByTextureKey.set(textureKey, sheet.meta);
 
-        const roleList = this.llmTexturesByRole.get(sheet.meta.role) ?? [];
-        roleList.push(textureKey);
-        this.llmTexturesByRole.set(sheet.meta.role, roleList);
+        // Список роли создаём и кладём в Map только при первом спрайте этой роли
+        const roleList = this.llmTexturesByRole.get(sheet.meta.role);
+        if (roleList) {
+          roleList.push(textureKey);
+        } else {
+          this.llmTexturesByRole.set(sheet.meta.role, [textureKey]);
+        }
       } catch (error) {
         // Игнорируем ошибки загрузки отдельных текстур
       }
@@ -572,10 +605,9 @@ export abstract class BaseGameScene extends Phaser.Scene {
     normalized = normalized.replace(/[^a-f0-9]/gi, '');
 
     if (normalized.length === 3) {
-      normalized = normalized
-        .split('')
-        .map((ch) => ch + ch)
-        .join('');
+      // Короткую форму #rgb разворачиваем прямой индексацией, без split/map/join
+      normalized =
+        normalized[0] + normalized[0] + normalized[1] + normalized[1] + normalized[2] + normalized[2];
     }
 
     if (normalized.length !== 6) {
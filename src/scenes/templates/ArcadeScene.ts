@@ -16,6 +16,20 @@ import type {
 type EnemyType = 'basic' | 'zigzag' | 'tank';
 type PowerUpType = 'shield' | 'rapid' | 'spread';
 
+// Поля врага в DataManager, которые читаются каждый кадр
+interface ArcadeEnemyData {
+  pattern?: EnemyType;
+  zigzagAmplitude?: number;
+  zigzagSpeed?: number;
+  zigzagSeed?: number;
+  nextShot?: number;
+  shootDelay?: number;
+  ability?: ArcadeEnemyAbility;
+  abilityNext?: number;
+  shieldUntil?: number;
+  dashResetAt?: number;
+}
+
 export class ArcadeScene extends VerticalBaseScene {
   private player!: Phaser.Physics.Arcade.Sprite;
   private bullets!: Phaser.Physics.Arcade.Group;
@@ -23,6 +37,7 @@ export class ArcadeScene extends VerticalBaseScene {
   private enemyLasers!: Phaser.Physics.Arcade.Group;
   private powerUps!: Phaser.Physics.Arcade.Group;
   private parallaxLayers: Phaser.GameObjects.Rectangle[] = [];
+  private backgroundCenterY: number = 0;
   private starEmitter?: Phaser.GameObjects.Particles.ParticleEmitter;
   private keyboardControls?: Phaser.Types.Input.Keyboard.CursorKeys;
 
@@ -47,6 +62,8 @@ export class ArcadeScene extends VerticalBaseScene {
 
   private comboMultiplier: number = 1;
   private comboText!: Phaser.GameObjects.Text;
+  // Множитель, который сейчас показан в HUD: на потолке комбо строку не пересобираем
+  private renderedComboMultiplier: number | null = null;
   private comboResetEvent?: Phaser.Time.TimerEvent;
 
   private touchTargetX?: number;
@@ -70,6 +87,9 @@ export class ArcadeScene extends VerticalBaseScene {
   private currentFireRateMultiplier: number = 1;
   private enemyProfilesMap: Map<string, ArcadeEnemyProfile> = new Map();
   private powerUpPool: ArcadePowerUpProfile[] = [];
+  // Накопленные веса для случайного выбора: бинарный поиск вместо суммирования на каждый бросок
+  private powerUpCumulativeWeights: number[] = [];
+  private waveMixCumulativeWeights: Map<ArcadeWaveDefinition, number[]> = new Map();
   private spawnRateFactor: number = 1;
   private maxEnemiesOnScreen: number = 8;
   private playerWeaponsMap: Map<string, PlayerWeaponProfile> = new Map();
@@ -77,6 +97,14 @@ export class ArcadeScene extends VerticalBaseScene {
   private currentPlayerWeapon?: PlayerWeaponProfile;
   private currentHeroHull?: HeroHullProfile;
   private playerWeaponCooldown: number = 0;
+  // Буферы координат врагов для самонаводящихся пуль, переиспользуются между кадрами
+  private homingTargetXs: number[] = [];
+  private homingTargetYs: number[] = [];
+  // Процедурные текстуры врагов по типу: строятся один раз, дальше только чтение из таблицы
+  private enemyTextureByType: Map<EnemyType, string> = new Map();
+  // Текстуры снарядов тоже неизменны: ключ получаем один раз, а не собираем строку на каждый выстрел
+  private playerBulletTexture?: string;
+  private enemyLaserTextureByColor: Map<number, string> = new Map();
 
   private loadVariantSettings(): void {
     const defaults = this.getDefaultVariantSettings();
@@ -93,6 +121,10 @@ export class ArcadeScene extends VerticalBaseScene {
     }
     this.enemyProfilesMap = new Map(this.variantSettings.enemyProfiles.map((profile) => [profile.id, profile]));
     this.powerUpPool = this.variantSettings.powerUps;
+    this.powerUpCumulativeWeights = this.buildCumulativeWeights(
+      this.powerUpPool.map((item) => (item.dropChance > 0 ? item.dropChance : 1)),
+    );
+    this.waveMixCumulativeWeights.clear();
     this.playerWeaponsMap = new Map(this.variantSettings.playerWeapons.map((weapon) => [weapon.id, weapon]));
     this.heroHullsMap = new Map(this.variantSettings.heroHulls.map((hull) => [hull.id, hull]));
     
@@ -739,6 +771,7 @@ export class ArcadeScene extends VerticalBaseScene {
     this.parallaxLayers = [];
     this.starEmitter?.destroy();
     this.starEmitter = undefined;
+    this.backgroundCenterY = this.scale.height / 2;
 
     const fullBg = this.add.rectangle(this.scale.width / 2, this.scale.height / 2, this.scale.width, this.scale.height, 0x030711, 1);
     fullBg.setDepth(-5).setScrollFactor(0);
@@ -760,6 +793,7 @@ export class ArcadeScene extends VerticalBaseScene {
 
   private updateBackgroundLayout(): void {
     const centersY = this.scale.height / 2;
+    this.backgroundCenterY = centersY;
     this.parallaxLayers.forEach((layer, index) => {
       layer.x = this.safeBounds.centerX;
       layer.y = centersY;
@@ -778,9 +812,13 @@ export class ArcadeScene extends VerticalBaseScene {
 
   private animateBackground(delta: number): void {
     const drift = delta * 0.003;
+    // Центр слоёв обновляется в updateBackgroundLayout, здесь только смещение от него
+    const centerY = this.backgroundCenterY;
+    const phase = this.time.now * 0.0002;
     this.parallaxLayers.forEach((layer, index) => {
-      layer.rotation += 0.0003 * (index + 1);
-      layer.y = this.scale.height / 2 + Math.sin(this.time.now * 0.0002 + index) * 5 * (index + 1) * drift;
+      const depth = index + 1;
+      layer.rotation += 0.0003 * depth;
+      layer.y = centerY + Math.sin(phase + index) * 5 * depth * drift;
     });
   }
 
@@ -901,6 +939,7 @@ export class ArcadeScene extends VerticalBaseScene {
       })
       .setScrollFactor(0)
       .setDepth(5);
+    this.renderedComboMultiplier = null;
 
     this.codenameText = this.add
       .text(this.safeBounds.centerX, 16, this.variantSettings.codename, {
@@ -1071,7 +1110,9 @@ export class ArcadeScene extends VerticalBaseScene {
   }
 
   private createBullet(offsetX: number, velocityY?: number, weapon?: PlayerWeaponProfile): void {
-    const bulletTexture = this.ensureRoundedRectTexture('player_bullet', 8, 24, 0xfff176, 4);
+    const bulletTexture =
+      this.playerBulletTexture ??
+      (this.playerBulletTexture = this.ensureRoundedRectTexture('player_bullet', 8, 24, 0xfff176, 4));
     const bullet = this.bullets.create(this.player.x + offsetX, this.player.y - 30, bulletTexture) as Phaser.Physics.Arcade.Sprite;
     this.disableGravity(bullet);
     const activeWeapon = weapon ?? this.currentPlayerWeapon ?? this.variantSettings.playerWeapons[0];
@@ -1127,11 +1168,12 @@ export class ArcadeScene extends VerticalBaseScene {
     enemy.setData('hp', profile?.hp ?? 1);
     const weapon = profile?.weapon;
     const ability = profile?.ability;
+    // Оружие и способность — общие данные профиля, враги их только читают, поэтому копии не нужны
     if (weapon) {
-      enemy.setData('weapon', { ...weapon });
+      enemy.setData('weapon', weapon);
     }
     if (ability) {
-    enemy.setData('ability', { ...ability });
+      enemy.setData('ability', ability);
       const initialDelay = (ability.cooldown ?? 3) * 1000 * Phaser.Math.FloatBetween(0.4, 0.9);
       enemy.setData('abilityNext', this.time.now + initialDelay);
     }
@@ -1164,25 +1206,41 @@ export class ArcadeScene extends VerticalBaseScene {
       return llmTexture;
     }
 
+    const cached = this.enemyTextureByType.get(type);
+    if (cached) {
+      return cached;
+    }
+
+    let textureKey: string;
     switch (type) {
       case 'zigzag':
-        return this.ensureRoundedRectTexture('enemy_zigzag', 34, 26, 0xffc107, 6);
+        textureKey = this.ensureRoundedRectTexture('enemy_zigzag', 34, 26, 0xffc107, 6);
+        break;
       case 'tank':
-        return this.ensureRoundedRectTexture('enemy_tank', 40, 34, 0xff5252, 4);
+        textureKey = this.ensureRoundedRectTexture('enemy_tank', 40, 34, 0xff5252, 4);
+        break;
       default:
-        return this.ensureRoundedRectTexture('enemy_basic', 30, 28, 0x29b6f6, 4);
+        textureKey = this.ensureRoundedRectTexture('enemy_basic', 30, 28, 0x29b6f6, 4);
+        break;
     }
+    this.enemyTextureByType.set(type, textureKey);
+    return textureKey;
   }
 
   private updateEnemies(delta: number): void {
-    this.enemies.getChildren().forEach((child) => {
+    // Нижняя граница экрана одна на кадр; копия списка — враг может быть уничтожен во время обхода
+    const escapeY = this.scale.height + 50;
+    this.enemies.getChildren().slice().forEach((child) => {
       const enemy = child as Phaser.Physics.Arcade.Sprite;
       if (!enemy.active) return;
-      this.updateEnemyBehavior(enemy, delta);
+      this.updateEnemyBehavior(enemy, delta, escapeY);
     });
   }
 
   private updatePlayerBullets(_delta: number): void {
+    // Координаты врагов снимаем один раз за кадр и только если есть хотя бы одна самонаводящаяся пуля
+    let targetCount = -1;
+
     this.bullets.getChildren().forEach((child) => {
       const bullet = child as Phaser.Physics.Arcade.Sprite;
       if (!bullet.active) return;
@@ -1197,75 +1255,99 @@ export class ArcadeScene extends VerticalBaseScene {
         return;
       }
 
-      let target: Phaser.Physics.Arcade.Sprite | null = null;
+      if (targetCount < 0) {
+        targetCount = this.collectHomingTargets();
+      }
+
+      let bestIndex = -1;
       let bestDistSq = Number.POSITIVE_INFINITY;
-      this.enemies.getChildren().forEach((enemyChild) => {
-        const enemy = enemyChild as Phaser.Physics.Arcade.Sprite;
-        if (!enemy.active) return;
-        const dx = enemy.x - bullet.x;
-        const dy = enemy.y - bullet.y;
+      for (let i = 0; i < targetCount; i++) {
+        const dx = this.homingTargetXs[i] - bullet.x;
+        const dy = this.homingTargetYs[i] - bullet.y;
         const distSq = dx * dx + dy * dy;
         if (distSq < bestDistSq) {
           bestDistSq = distSq;
-          target = enemy;
+          bestIndex = i;
         }
-      });
+      }
 
-      const targetSprite = target as Phaser.Physics.Arcade.Sprite | null;
-      if (!targetSprite) return;
+      if (bestIndex < 0) return;
+      if (bestDistSq === 0) {
+        // Как раньше с Angle.Between: atan2(0, 0) = 0, пуля уходит вправо с полной скоростью
+        bullet.setVelocity(speed, 0);
+        return;
+      }
 
-      const angle = Phaser.Math.Angle.Between(bullet.x, bullet.y, targetSprite.x, targetSprite.y);
-      bullet.setVelocity(Math.cos(angle) * speed, Math.sin(angle) * speed);
+      const scale = speed / Math.sqrt(bestDistSq);
+      bullet.setVelocity(
+        (this.homingTargetXs[bestIndex] - bullet.x) * scale,
+        (this.homingTargetYs[bestIndex] - bullet.y) * scale,
+      );
     });
   }
 
-  private updateEnemyBehavior(enemy: Phaser.Physics.Arcade.Sprite, delta: number): void {
-    const pattern = (enemy.getData('pattern') as EnemyType | undefined) ?? 'basic';
+  private collectHomingTargets(): number {
+    let count = 0;
+    this.enemies.getChildren().forEach((enemyChild) => {
+      const enemy = enemyChild as Phaser.Physics.Arcade.Sprite;
+      if (!enemy.active) return;
+      this.homingTargetXs[count] = enemy.x;
+      this.homingTargetYs[count] = enemy.y;
+      count++;
+    });
+    return count;
+  }
+
+  private updateEnemyBehavior(enemy: Phaser.Physics.Arcade.Sprite, delta: number, escapeY: number): void {
+    // Все поля врага читаем одним списком DataManager вместо десятка getData за кадр
+    const data = enemy.data.list as ArcadeEnemyData;
+    const now = this.time.now;
+    const pattern = data.pattern ?? 'basic';
     if (pattern === 'zigzag') {
-      const amplitude = (enemy.getData('zigzagAmplitude') as number | undefined) ?? 20;
-      const speed = (enemy.getData('zigzagSpeed') as number | undefined) ?? 0.003;
-      const seed = (enemy.getData('zigzagSeed') as number | undefined) ?? 0;
-      const offset = Math.sin(this.time.now * speed + seed) * amplitude * (delta / 16.6);
+      const amplitude = data.zigzagAmplitude ?? 20;
+      const speed = data.zigzagSpeed ?? 0.003;
+      const seed = data.zigzagSeed ?? 0;
+      const offset = Math.sin(now * speed + seed) * amplitude * (delta / 16.6);
       enemy.x = this.clampToSafeBounds(enemy.x + offset);
     }
 
-    if (enemy.y > this.scale.height + 50) {
+    if (enemy.y > escapeY) {
       enemy.destroy();
       this.applyDamage(1);
       return;
     }
 
-    this.handleEnemyAbility(enemy);
+    this.handleEnemyAbility(enemy, data, now);
 
-    const nextShot = enemy.getData('nextShot') as number | undefined;
-    const shootDelay = (enemy.getData('shootDelay') as number | undefined) ?? 1200;
-    if (nextShot && this.time.now >= nextShot) {
+    const nextShot = data.nextShot;
+    const shootDelay = data.shootDelay ?? 1200;
+    if (nextShot && now >= nextShot) {
       this.enemyShoot(enemy);
-      enemy.setData('nextShot', this.time.now + shootDelay);
+      enemy.setData('nextShot', now + shootDelay);
     }
   }
 
-  private handleEnemyAbility(enemy: Phaser.Physics.Arcade.Sprite): void {
-    const ability = enemy.getData('ability') as ArcadeEnemyAbility | undefined;
+  private handleEnemyAbility(enemy: Phaser.Physics.Arcade.Sprite, data: ArcadeEnemyData, now: number): void {
+    const ability = data.ability;
     if (ability) {
-      const next = (enemy.getData('abilityNext') as number | undefined) ?? 0;
-      if (this.time.now >= next) {
+      const next = data.abilityNext ?? 0;
+      if (now >= next) {
         this.triggerEnemyAbility(enemy, ability);
         const cooldown = Math.max(ability.cooldown ?? 3, 0.5) * 1000;
-        enemy.setData('abilityNext', this.time.now + cooldown);
+        enemy.setData('abilityNext', now + cooldown);
       }
     }
 
-    const shieldUntil = enemy.getData('shieldUntil') as number | undefined;
-    if (shieldUntil && this.time.now >= shieldUntil) {
+    const shieldUntil = data.shieldUntil;
+    if (shieldUntil && now >= shieldUntil) {
       enemy.setData('shieldUntil', undefined);
       if (enemy.active) {
         enemy.clearTint();
       }
     }
 
-    const dashResetAt = enemy.getData('dashResetAt') as number | undefined;
-    if (dashResetAt && this.time.now >= dashResetAt) {
+    const dashResetAt = data.dashResetAt;
+    if (dashResetAt && now >= dashResetAt) {
       enemy.setData('dashResetAt', undefined);
       enemy.setVelocityX(0);
     }
@@ -1342,23 +1424,26 @@ export class ArcadeScene extends VerticalBaseScene {
   }
 
   private recycleObjects(): void {
-    this.bullets.getChildren().forEach((child) => {
+    const bottomLimit = this.scale.height + 40;
+
+    // Обходим копии: destroy удаляет объект из группы прямо во время обхода
+    this.bullets.getChildren().slice().forEach((child) => {
       const bullet = child as Phaser.Physics.Arcade.Sprite;
       if (bullet.y < -40) {
         bullet.destroy();
       }
     });
 
-    this.enemyLasers.getChildren().forEach((child) => {
+    this.enemyLasers.getChildren().slice().forEach((child) => {
       const laser = child as Phaser.Physics.Arcade.Sprite;
-      if (laser.y > this.scale.height + 40) {
+      if (laser.y > bottomLimit) {
         laser.destroy();
       }
     });
 
-    this.powerUps.getChildren().forEach((child) => {
+    this.powerUps.getChildren().slice().forEach((child) => {
       const power = child as Phaser.Physics.Arcade.Sprite;
-      if (power.y > this.scale.height + 40) {
+      if (power.y > bottomLimit) {
         power.destroy();
       }
     });
@@ -1368,7 +1453,11 @@ export class ArcadeScene extends VerticalBaseScene {
     if (!this.canSpawnEnemyProjectile()) {
       return undefined;
     }
-    const texture = this.ensureRoundedRectTexture(`enemy_laser_${color.toString(16)}`, 6, 22, color, 3);
+    let texture = this.enemyLaserTextureByColor.get(color);
+    if (!texture) {
+      texture = this.ensureRoundedRectTexture(`enemy_laser_${color.toString(16)}`, 6, 22, color, 3);
+      this.enemyLaserTextureByColor.set(color, texture);
+    }
     const projectile = this.enemyLasers.create(x, y, texture) as Phaser.Physics.Arcade.Sprite;
     this.disableGravity(projectile);
     const angleRad = Phaser.Math.DegToRad(angleDeg);
@@ -1500,15 +1589,36 @@ export class ArcadeScene extends VerticalBaseScene {
     if (this.powerUpPool.length === 0) {
       return undefined;
     }
-    const total = this.powerUpPool.reduce((sum, item) => sum + item.dropChance, 0);
-    let roll = Math.random() * (total > 0 ? total : this.powerUpPool.length);
-    for (const profile of this.powerUpPool) {
-      roll -= profile.dropChance > 0 ? profile.dropChance : 1;
-      if (roll <= 0) {
-        return profile;
+    const cumulative = this.powerUpCumulativeWeights;
+    const index = this.findCumulativeIndex(cumulative, Math.random() * cumulative[cumulative.length - 1]);
+    return this.powerUpPool[index] ?? this.powerUpPool[0];
+  }
+
+  private buildCumulativeWeights(weights: number[]): number[] {
+    const cumulative: number[] = [];
+    let sum = 0;
+    for (const weight of weights) {
+      sum += weight;
+      cumulative.push(sum);
+    }
+    return cumulative;
+  }
+
+  private findCumulativeIndex(cumulative: number[], roll: number): number {
+    // Первый индекс, где накопленный вес не меньше броска; -1, если бросок за пределами суммы
+    let low = 0;
+    let high = cumulative.length - 1;
+    let found = -1;
+    while (low <= high) {
+      const mid = (low + high) >> 1;
+      if (cumulative[mid] >= roll) {
+        found = mid;
+        high = mid - 1;
+      } else {
+        low = mid + 1;
       }
     }
-    return this.powerUpPool[0];
+    return found;
   }
 
   private activateShield(durationMs: number): void {
@@ -1571,7 +1681,8 @@ export class ArcadeScene extends VerticalBaseScene {
   }
 
   private registerComboHit(): void {
-    this.comboMultiplier = Phaser.Math.Clamp(this.comboMultiplier + 0.2, 1, 4);
+    // Множитель квантуем до десятых арифметически, без форматирования в строку и обратного разбора
+    this.comboMultiplier = Math.round(Phaser.Math.Clamp(this.comboMultiplier + 0.2, 1, 4) * 10) / 10;
     this.updateComboText();
     this.comboResetEvent?.remove(false);
     this.comboResetEvent = this.time.addEvent({
@@ -1584,7 +1695,8 @@ export class ArcadeScene extends VerticalBaseScene {
   }
 
   private updateComboText(): void {
-    if (this.comboText) {
+    if (this.comboText && this.comboMultiplier !== this.renderedComboMultiplier) {
+      this.renderedComboMultiplier = this.comboMultiplier;
       this.comboText.setText(`${this.comboLabel} x${this.comboMultiplier.toFixed(1)}`);
     }
   }
@@ -1730,16 +1842,21 @@ export class ArcadeScene extends VerticalBaseScene {
 
   private pickEnemyProfileForWave(wave: ArcadeWaveDefinition): ArcadeEnemyProfile {
     const fallback = this.variantSettings.enemyProfiles[0];
-    const mix = Array.isArray(wave.enemyMix) && wave.enemyMix.length > 0 ? wave.enemyMix : [{ enemyId: fallback.id, weight: 1 }];
-    const total = mix.reduce((sum, entry) => sum + entry.weight, 0);
-    let roll = Math.random() * (total > 0 ? total : mix.length);
-    for (const entry of mix) {
-      roll -= entry.weight;
-      if (roll <= 0) {
-        return this.enemyProfilesMap.get(entry.enemyId) ?? fallback;
-      }
+    const mix = wave.enemyMix;
+    if (!Array.isArray(mix) || mix.length === 0) {
+      return fallback;
+    }
+    let cumulative = this.waveMixCumulativeWeights.get(wave);
+    if (!cumulative) {
+      cumulative = this.buildCumulativeWeights(mix.map((entry) => entry.weight));
+      this.waveMixCumulativeWeights.set(wave, cumulative);
+    }
+    const total = cumulative[cumulative.length - 1];
+    const index = this.findCumulativeIndex(cumulative, Math.random() * (total > 0 ? total : mix.length));
+    if (index < 0) {
+      return fallback;
     }
-    return fallback;
+    return this.enemyProfilesMap.get(mix[index].enemyId) ?? fallback;
   }
 
   private completeObjective(): void {
@@ -1758,9 +1875,7 @@ export class ArcadeScene extends VerticalBaseScene {
     this.gameEnded = true;
     const centerX = this.scale.width / 2;
     const centerY = this.scale.height / 2;
-    const overlay = this.add.rectangle(centerX, centerY, this.scale.width, this.scale.height, 0x000000, 0.82);
-    overlay.setScrollFactor(0);
-    overlay.setDepth(10);
+    this.showScreenOverlay(0.82);
 
     const title = this.add
       .text(centerX, centerY - 60, 'Миссия выполнена!', {
@@ -9,6 +9,12 @@ import type {
   PlatformerPowerUp,
 } from '@/types';
 
+// Допустимые значения полей варианта: проверка через Set вместо создания массива на каждый элемент
+const OBJECTIVE_TYPES: ReadonlySet<string> = new Set(['collect', 'score', 'survive']);
+const ENEMY_BEHAVIORS: ReadonlySet<string> = new Set(['patrol', 'chaser', 'hopper']);
+const POWER_UP_EFFECTS: ReadonlySet<string> = new Set(['speed', 'shield', 'scoreBoost']);
+const HAZARD_STYLES: ReadonlySet<string> = new Set(['static', 'pulse', 'slide']);
+
 export class PlatformerScene extends VerticalBaseScene {
   private player!: Phaser.Physics.Arcade.Sprite;
   private platforms!: Phaser.Physics.Arcade.StaticGroup;
@@ -34,6 +40,8 @@ export class PlatformerScene extends VerticalBaseScene {
   private comboMultiplier = 1;
   private comboResetEvent?: Phaser.Time.TimerEvent;
   private comboText!: Phaser.GameObjects.Text;
+  // Множитель, который сейчас показан в HUD: на потолке комбо строку не пересобираем
+  private renderedComboMultiplier: number | null = null;
   private parallaxLayers: Phaser.GameObjects.Rectangle[] = [];
   private readonly defaultPalette: number[] = [0x0a1428, 0x00bfff, 0xffffff, 0x708090, 0xffc107];
   private variantPalette: number[] | null = null;
@@ -65,6 +73,8 @@ export class PlatformerScene extends VerticalBaseScene {
   private objectiveType: PlatformerObjectiveType = 'collect';
   private objectiveDescription: string = 'Собери все звезды';
   private objectiveText!: Phaser.GameObjects.Text;
+  // Последний показанный прогресс цели: описание статично, текст пересобираем только при смене прогресса
+  private renderedObjectiveProgress: string | null = null;
   private objectiveTargetCount: number = 18;
   private objectiveTargetScore: number = 600;
   private objectiveProgress: number = 0;
@@ -283,7 +293,7 @@ export class PlatformerScene extends VerticalBaseScene {
       return fallback;
     }
 
-    const validType: PlatformerObjectiveType = ['collect', 'score', 'survive'].includes(source.type ?? '')
+    const validType: PlatformerObjectiveType = OBJECTIVE_TYPES.has(source.type ?? '')
       ? (source.type as PlatformerObjectiveType)
       : fallback.type;
 
@@ -315,7 +325,7 @@ export class PlatformerScene extends VerticalBaseScene {
           id: this.getString(item.id, base.id),
           name: this.getString(item.name, base.name),
           description: this.getString(item.description, base.description),
-          behavior: ['patrol', 'chaser', 'hopper'].includes(item.behavior ?? '')
+          behavior: ENEMY_BEHAVIORS.has(item.behavior ?? '')
             ? (item.behavior as PlatformerEnemyArchetype['behavior'])
             : base.behavior,
           ability: this.getString(item.ability, base.ability),
@@ -356,7 +366,7 @@ export class PlatformerScene extends VerticalBaseScene {
           return undefined;
         }
         const base = fallback[index % Math.max(1, fallback.length)];
-        const validEffect = ['speed', 'shield', 'scoreBoost'].includes(item.effect ?? '')
+        const validEffect = POWER_UP_EFFECTS.has(item.effect ?? '')
           ? (item.effect as PlatformerPowerUp['effect'])
           : base?.effect ?? 'speed';
         return {
@@ -380,7 +390,7 @@ export class PlatformerScene extends VerticalBaseScene {
       return fallback;
     }
 
-    const validStyle: PlatformerHazardPack['specialStyle'] = ['static', 'pulse', 'slide'].includes(source.specialStyle ?? '')
+    const validStyle: PlatformerHazardPack['specialStyle'] = HAZARD_STYLES.has(source.specialStyle ?? '')
       ? source.specialStyle
       : fallback.specialStyle;
 
@@ -425,10 +435,9 @@ export class PlatformerScene extends VerticalBaseScene {
     }
     normalized = normalized.replace(/[^a-f0-9]/gi, '');
     if (normalized.length === 3) {
-      normalized = normalized
-        .split('')
-        .map((ch) => ch + ch)
-        .join('');
+      // Короткую форму #rgb разворачиваем прямой индексацией, без split/map/join
+      normalized =
+        normalized[0] + normalized[0] + normalized[1] + normalized[1] + normalized[2] + normalized[2];
     }
     if (normalized.length !== 6) {
       return null;
@@ -878,6 +887,7 @@ export class PlatformerScene extends VerticalBaseScene {
         fontFamily: 'Arial',
       })
       .setScrollFactor(0);
+    this.renderedComboMultiplier = null;
 
     this.objectiveText = this.add
       .text(padding, padding + 26, '', {
@@ -886,6 +896,7 @@ export class PlatformerScene extends VerticalBaseScene {
         fontFamily: 'Arial',
       })
       .setScrollFactor(0);
+    this.renderedObjectiveProgress = null;
 
     this.powerUpText = this.add
       .text(padding, padding + 46, 'Бонусы: нет', {
@@ -924,7 +935,10 @@ export class PlatformerScene extends VerticalBaseScene {
       callback: () => {
         this.timeLeft -= 1;
         this.timerText.setText(this.formatTime(Math.max(this.timeLeft, 0)));
-        this.updateObjectiveText();
+        // От таймера зависит только подпись цели «выжить»; остальные обновляются по событиям
+        if (this.objectiveType === 'survive') {
+          this.updateObjectiveText();
+        }
         if (this.timeLeft <= 0) {
           this.timerEvent?.remove(false);
           if (this.objectiveType === 'survive') {
@@ -955,26 +969,35 @@ export class PlatformerScene extends VerticalBaseScene {
   }
 
   private updateEnemyBehaviorLogic(): void {
+    // Поведение считаем только для врагов рядом с видимой областью (экран сверху и снизу про запас)
+    const view = this.cameras.main.worldView;
+    const activeTop = view.y - view.height;
+    const activeBottom = view.bottom + view.height;
+    // Общие для всех врагов значения кадра читаем один раз, а не на каждого врага
+    const now = this.time.now;
+    const playerX = this.player.x;
+    const speedBoost = this.speedBoostMultiplier;
     this.enemies.getChildren().forEach((child) => {
       const enemy = child as Phaser.Physics.Arcade.Sprite;
       if (!enemy.active || !enemy.body) return;
+      if (enemy.y < activeTop || enemy.y > activeBottom) return;
       const archetype = enemy.getData('archetype') as PlatformerEnemyArchetype | undefined;
       if (!archetype) return;
 
       const baseSpeed = (enemy.getData('baseSpeed') as number | undefined) ?? 80;
       if (archetype.behavior === 'chaser') {
-        const direction = this.player.x < enemy.x ? -1 : 1;
-        enemy.setVelocityX(direction * baseSpeed * this.speedBoostMultiplier);
+        const direction = playerX < enemy.x ? -1 : 1;
+        enemy.setVelocityX(direction * baseSpeed * speedBoost);
         if (enemy.body.blocked.down && Math.random() < archetype.aggression * 0.02) {
           enemy.setVelocityY(-archetype.jumpStrength);
         }
       } else if (archetype.behavior === 'hopper') {
         const nextJump = (enemy.getData('nextJump') as number | undefined) ?? 0;
-        if (enemy.body.blocked.down && this.time.now >= nextJump) {
+        if (enemy.body.blocked.down && now >= nextJump) {
           enemy.setVelocityY(-archetype.jumpStrength);
-          enemy.setData('nextJump', this.time.now + Phaser.Math.Between(700, 1400));
+          enemy.setData('nextJump', now + Phaser.Math.Between(700, 1400));
         }
-        const drift = Math.sin(this.time.now * 0.001 + enemy.x * 0.01);
+        const drift = Math.sin(now * 0.001 + enemy.x * 0.01);
         enemy.setVelocityX(drift * baseSpeed);
       } else {
         if (enemy.body.blocked.left) {
@@ -989,6 +1012,8 @@ export class PlatformerScene extends VerticalBaseScene {
   private updateObjectiveText(): void {
     if (!this.objectiveText) return;
     const progress = this.getObjectiveProgressLabel();
+    if (progress === this.renderedObjectiveProgress) return;
+    this.renderedObjectiveProgress = progress;
     const suffix = progress ? ` (${progress})` : '';
     this.objectiveText.setText(`Цель: ${this.objectiveDescription}${suffix}`);
   }
@@ -1129,8 +1154,7 @@ export class PlatformerScene extends VerticalBaseScene {
     this.gameEnded = true;
     const centerX = this.scale.width / 2;
     const centerY = this.scale.height / 2;
-    const overlay = this.add.rectangle(centerX, centerY, this.scale.width, this.scale.height, 0x000000, 0.82);
-    overlay.setScrollFactor(0);
+    this.showScreenOverlay(0.82, 0);
 
     const title = this.add
       .text(centerX, centerY - 70, 'Миссия выполнена!', {
@@ -1174,7 +1198,8 @@ export class PlatformerScene extends VerticalBaseScene {
   }
 
   private updateComboText(): void {
-    if (this.comboText) {
+    if (this.comboText && this.comboMultiplier !== this.renderedComboMultiplier) {
+      this.renderedComboMultiplier = this.comboMultiplier;
       this.comboText.setText(`${this.comboLabel} x${this.comboMultiplier.toFixed(1)}`);
     }
   }
@@ -1197,7 +1222,8 @@ export class PlatformerScene extends VerticalBaseScene {
     if (this.objectiveType === 'collect') {
       this.objectiveProgress = Math.min(this.objectiveTargetCount, this.objectiveProgress + 1);
     }
-    this.comboMultiplier = Math.min(this.comboMultiplier + 0.2, 3);
+    // Держим множитель на сетке 0.1: без накопления ошибки (1.7999… вместо 1.8) и с тем же значением, что в HUD
+    this.comboMultiplier = Math.round(Math.min(this.comboMultiplier + 0.2, 3) * 10) / 10;
     const baseValue = this.collectibleScoreValue * (this.scoreBoostActive ? 1.5 : 1);
     this.updateScore(Math.floor(baseValue * this.comboMultiplier));
     this.updateComboText();
@@ -1272,22 +1298,24 @@ export class PlatformerScene extends VerticalBaseScene {
     }
 
     // Актуализируем параллакс
+    const scrollY = this.cameras.main.scrollY;
     this.parallaxLayers.forEach((layer, index) => {
-      layer.y = this.cameras.main.scrollY * (0.1 * (index + 1));
+      layer.y = scrollY * (0.1 * (index + 1));
     });
 
     this.updateEnemyBehaviorLogic();
 
-    // Очищаем препятствия за пределами экрана
+    // Очищаем препятствия за пределами экрана (нижняя граница кадра считается один раз)
+    const viewBottom = scrollY + this.scale.height;
     this.obstacles.getChildren().forEach((obstacle) => {
       const sprite = obstacle as Phaser.Physics.Arcade.Sprite;
-      if (sprite.y > this.cameras.main.scrollY + this.scale.height + 80) {
+      if (sprite.y > viewBottom + 80) {
         sprite.destroy();
       }
     });
     this.powerUps.getChildren().forEach((child) => {
       const sprite = child as Phaser.Physics.Arcade.Sprite;
-      if (sprite.y > this.cameras.main.scrollY + this.scale.height + 40) {
+      if (sprite.y > viewBottom + 40) {
         sprite.destroy();
       }
     });
@@ -22,7 +22,7 @@ interface PuzzleBlock {
 }
 
 interface MatchScanResult {
-  mask: boolean[][];
+  mask: Uint8Array;
   groups: number;
 }
 
@@ -44,13 +44,17 @@ interface NormalizedBlockType {
 }
 
 export class PuzzleScene extends VerticalBaseScene {
-  private grid: (PuzzleBlock | null)[][] = [];
+  // Поле хранится плоским массивом по строкам (row * gridSize + col), как и маски клеток
+  private grid: (PuzzleBlock | null)[] = [];
   private gridSize: number = 6;
   private blockSize: number = 0;
   private cellGap: number = 6;
 
   private layoutStartX: number = 0;
   private layoutStartY: number = 0;
+  // Координаты центров столбцов и строк, пересчитываются только вместе с раскладкой
+  private columnXs: number[] = [];
+  private rowYs: number[] = [];
 
   private selectedBlock: PuzzleBlock | null = null;
   private matches: number = 0;
@@ -67,13 +71,23 @@ export class PuzzleScene extends VerticalBaseScene {
   };
   private normalizedBlockTypes: NormalizedBlockType[] = [];
   private totalSpawnWeight: number = 0;
+  // Накопленные веса типов блоков: бросок находит тип бинарным поиском, а не обходом списка
+  private spawnWeightCumulative: number[] = [];
   private blockTypeMap: Map<string, NormalizedBlockType> = new Map();
   private bonusRules: PuzzleBonusRule[] = [];
-  private triggeredBonuses: Set<string> = new Set();
+  // Флаги сработавших бонусов по индексу правила: проверка — чтение байта, а не поиск строки в Set
+  private triggeredBonusFlags: Uint8Array = new Uint8Array(0);
   private boardModifiersRaw?: PuzzleBoardModifier;
-  private blockedCells: Set<string> = new Set();
-  private boardDecorations: Phaser.GameObjects.Rectangle[] = [];
+  // Маска заблокированных клеток (row * gridSize + col): проверка клетки — обращение к типизированному массиву
+  private blockedMask: Uint8Array = new Uint8Array(0);
+  private blockedCellCount: number = 0;
+  // Маска совпадений переиспользуется между проходами каскада и очищается одним fill
+  private matchMask: Uint8Array = new Uint8Array(0);
+  // Клетки, задетые спецблоками: отмечаются сразу при обработке эффекта и вливаются в маску совпадений в конце
+  private effectMask: Uint8Array = new Uint8Array(0);
+  private boardDecorations: Phaser.GameObjects.Image[] = [];
   private bonusMessage: string = '';
+  private variantHudLabel: string = '';
   private bonusMessageTimer?: Phaser.Time.TimerEvent;
 
   private instructionText!: Phaser.GameObjects.Text;
@@ -182,9 +196,11 @@ export class PuzzleScene extends VerticalBaseScene {
       .setOrigin(0.5)
       .setScrollFactor(0);
 
+    // Заливка создаётся на всю ширину полосы, прогресс задаётся только масштабом по X
     this.progressBarFill = this.add
-      .rectangle(this.progressBarBg.x - this.progressBarWidth / 2, barY, 0, 12, 0x4caf50, 0.9)
+      .rectangle(this.progressBarBg.x - this.progressBarWidth / 2, barY, this.progressBarWidth, 12, 0x4caf50, 0.9)
       .setOrigin(0, 0.5)
+      .setScale(0, 1)
       .setScrollFactor(0);
 
     this.comboText = this.add
@@ -196,6 +212,7 @@ export class PuzzleScene extends VerticalBaseScene {
       .setOrigin(0.5)
       .setScrollFactor(0);
 
+    this.layoutHud();
     this.updateHud();
   }
 
@@ -205,37 +222,40 @@ export class PuzzleScene extends VerticalBaseScene {
   }
 
   private generateGrid(): void {
-    let attempt = 0;
-    let hasStartingMatches: boolean;
+    this.destroyGrid();
+    this.calculateLayout();
+    this.renderBoardDecorations();
 
+    // Повторные попытки перебирают только плоскую таблицу типов, спрайты создаются один раз в конце
+    const size = this.gridSize;
+    const draft: (NormalizedBlockType | null)[] = new Array(size * size);
+    let attempt = 0;
     do {
-      this.destroyGrid();
-      this.calculateLayout();
-      this.renderBoardDecorations();
-
-      for (let row = 0; row < this.gridSize; row++) {
-        for (let col = 0; col < this.gridSize; col++) {
-          if (this.isCellBlocked(row, col)) {
-            this.grid[row][col] = null;
-            continue;
-          }
-          this.createBlock(row, col);
+      for (let row = 0; row < size; row++) {
+        for (let col = 0; col < size; col++) {
+          const index = row * size + col;
+          draft[index] = this.blockedMask[index] === 1 ? null : this.pickBlockType();
         }
       }
-
-      hasStartingMatches = this.hasImmediateMatches();
       attempt++;
-    } while (hasStartingMatches && attempt < 8);
+    } while (this.hasImmediateMatches(draft) && attempt < 8);
+
+    for (let row = 0; row < size; row++) {
+      for (let col = 0; col < size; col++) {
+        const blockType = draft[row * size + col];
+        if (blockType) {
+          this.createBlock(row, col, blockType);
+        }
+      }
+    }
   }
 
   private destroyGrid(): void {
-    for (const row of this.grid) {
-      for (const block of row ?? []) {
-        block?.sprite.destroy();
-      }
+    for (const block of this.grid) {
+      block?.sprite.destroy();
     }
 
-    this.grid = Array.from({ length: this.gridSize }, () => Array<PuzzleBlock | null>(this.gridSize).fill(null));
+    this.grid = Array<PuzzleBlock | null>(this.gridSize * this.gridSize).fill(null);
     this.clearBoardDecorations();
   }
 
@@ -255,6 +275,10 @@ export class PuzzleScene extends VerticalBaseScene {
     const gridPixelSize = this.blockSize * this.gridSize + totalGap;
     this.layoutStartX = this.safeBounds.left + horizontalPadding + (availableWidth - gridPixelSize) / 2 + this.blockSize / 2;
     this.layoutStartY = this.safeBounds.top + innerTopPadding + (availableHeight - gridPixelSize) / 2 + this.blockSize / 2;
+
+    const step = this.blockSize + this.cellGap;
+    this.columnXs = Array.from({ length: this.gridSize }, (_, col) => this.layoutStartX + col * step);
+    this.rowYs = Array.from({ length: this.gridSize }, (_, row) => this.layoutStartY + row * step);
   }
 
   private createBlock(row: number, col: number, blockType?: NormalizedBlockType): PuzzleBlock {
@@ -281,15 +305,13 @@ export class PuzzleScene extends VerticalBaseScene {
     };
 
     sprite.on('pointerdown', () => this.selectBlock(block));
-    this.grid[row][col] = block;
+    this.grid[row * this.gridSize + col] = block;
 
     return block;
   }
 
   private getBlockPosition(row: number, col: number): { x: number; y: number } {
-    const x = this.layoutStartX + col * (this.blockSize + this.cellGap);
-    const y = this.layoutStartY + row * (this.blockSize + this.cellGap);
-    return { x, y };
+    return { x: this.columnXs[col], y: this.rowYs[row] };
   }
 
   private selectBlock(block: PuzzleBlock): void {
@@ -361,8 +383,8 @@ export class PuzzleScene extends VerticalBaseScene {
     block2.row = block1Row;
     block2.col = block1Col;
 
-    this.grid[block1.row][block1.col] = block1;
-    this.grid[block2.row][block2.col] = block2;
+    this.grid[block1.row * this.gridSize + block1.col] = block1;
+    this.grid[block2.row * this.gridSize + block2.col] = block2;
 
     this.positionBlockSprite(block1);
     this.positionBlockSprite(block2);
@@ -399,7 +421,7 @@ export class PuzzleScene extends VerticalBaseScene {
       const cascadeBonus = 1 + (cascades - 1) * 0.25;
 
       this.matches += scanResult.groups;
-      this.comboMultiplier = Number((1 + (cascades - 1) * 0.5).toFixed(1));
+      this.comboMultiplier = Math.round((1 + (cascades - 1) * 0.5) * 10) / 10;
       this.updateScore(Math.round(clearedBlocks * 15 * cascadeBonus));
 
       this.fillEmptySpaces();
@@ -420,89 +442,98 @@ export class PuzzleScene extends VerticalBaseScene {
   }
 
   private scanMatches(): MatchScanResult {
-    const mask = Array.from({ length: this.gridSize }, () => Array<boolean>(this.gridSize).fill(false));
+    const cellCount = this.gridSize * this.gridSize;
+    if (this.matchMask.length !== cellCount) {
+      this.matchMask = new Uint8Array(cellCount);
+    } else {
+      this.matchMask.fill(0);
+    }
+    const mask = this.matchMask;
+    const size = this.gridSize;
     let groups = 0;
 
+    // Серии считаем по началу и цвету, без промежуточных массивов блоков.
+    // Лишняя итерация за краем поля закрывает последнюю серию строки/столбца.
+
     // Горизонтальные цепочки
-    for (let row = 0; row < this.gridSize; row++) {
-      let streak: PuzzleBlock[] = [];
-      for (let col = 0; col < this.gridSize; col++) {
-        const block = this.grid[row][col];
-        if (block) {
-          if (streak.length === 0 || block.color === streak[0].color) {
-            streak.push(block);
-        } else {
-            if (streak.length >= 3) {
-              this.markStreak(mask, streak);
-              groups++;
-            }
-            streak = [block];
-          }
-        } else {
-          if (streak.length >= 3) {
-            this.markStreak(mask, streak);
-            groups++;
+    for (let row = 0; row < size; row++) {
+      let runStart = 0;
+      let runColor: number | null = null;
+      for (let col = 0; col <= size; col++) {
+        const block = col < size ? this.grid[row * size + col] : null;
+        const color = block ? block.color : null;
+        if (color !== null && color === runColor) {
+          continue;
+        }
+        if (runColor !== null && col - runStart >= 3) {
+          for (let c = runStart; c < col; c++) {
+            mask[row * size + c] = 1;
           }
-          streak = [];
+          groups++;
         }
-      }
-      if (streak.length >= 3) {
-        this.markStreak(mask, streak);
-        groups++;
+        runStart = col;
+        runColor = color;
       }
     }
 
     // Вертикальные цепочки
-    for (let col = 0; col < this.gridSize; col++) {
-      let streak: PuzzleBlock[] = [];
-      for (let row = 0; row < this.gridSize; row++) {
-        const block = this.grid[row][col];
-        if (block) {
-          if (streak.length === 0 || block.color === streak[0].color) {
-            streak.push(block);
-        } else {
-            if (streak.length >= 3) {
-              this.markStreak(mask, streak);
-              groups++;
-            }
-            streak = [block];
-          }
-        } else {
-          if (streak.length >= 3) {
-            this.markStreak(mask, streak);
-            groups++;
+    for (let col = 0; col < size; col++) {
+      let runStart = 0;
+      let runColor: number | null = null;
+      for (let row = 0; row <= size; row++) {
+        const block = row < size ? this.grid[row * size + col] : null;
+        const color = block ? block.color : null;
+        if (color !== null && color === runColor) {
+          continue;
+        }
+        if (runColor !== null && row - runStart >= 3) {
+          for (let r = runStart; r < row; r++) {
+            mask[r * size + col] = 1;
           }
-          streak = [];
+          groups++;
         }
-      }
-      if (streak.length >= 3) {
-        this.markStreak(mask, streak);
-        groups++;
+        runStart = row;
+        runColor = color;
       }
     }
 
     return { mask, groups };
   }
 
-  private hasImmediateMatches(): boolean {
-    const result = this.scanMatches();
-    return result.groups > 0;
-  }
-
-  private markStreak(mask: boolean[][], streak: PuzzleBlock[]): void {
-    for (const block of streak) {
-      mask[block.row][block.col] = true;
+  private hasImmediateMatches(draft: (NormalizedBlockType | null)[]): boolean {
+    // Достаточно найти первую тройку одного цвета: выходим сразу
+    const size = this.gridSize;
+    for (let row = 0; row < size; row++) {
+      for (let col = 0; col < size; col++) {
+        const index = row * size + col;
+        const blockType = draft[index];
+        if (!blockType) {
+          continue;
+        }
+        const color = blockType.color;
+        if (col + 2 < size && draft[index + 1]?.color === color && draft[index + 2]?.color === color) {
+          return true;
+        }
+        if (
+          row + 2 < size &&
+          draft[index + size]?.color === color &&
+          draft[index + size * 2]?.color === color
+        ) {
+          return true;
+        }
+      }
     }
+    return false;
   }
 
-  private destroyMatches(mask: boolean[][]): number {
+  private destroyMatches(mask: Uint8Array): number {
     this.applySpecialBlockEffects(mask);
     let removed = 0;
 
     for (let row = 0; row < this.gridSize; row++) {
       for (let col = 0; col < this.gridSize; col++) {
-        if (mask[row][col]) {
-          const block = this.grid[row][col];
+        if (mask[row * this.gridSize + col]) {
+          const block = this.grid[row * this.gridSize + col];
           if (!block) {
             continue;
           }
@@ -515,7 +546,7 @@ export class PuzzleScene extends VerticalBaseScene {
           }
 
           block.sprite.destroy();
-          this.grid[row][col] = null;
+          this.grid[row * this.gridSize + col] = null;
           removed++;
         }
       }
@@ -525,22 +556,28 @@ export class PuzzleScene extends VerticalBaseScene {
   }
 
   private fillEmptySpaces(): void {
-    for (let col = 0; col < this.gridSize; col++) {
-      let writeIndex = this.gridSize - 1;
-
-      for (let row = this.gridSize - 1; row >= 0; row--) {
-        if (this.isCellBlocked(row, col)) {
-          this.grid[row][col] = null;
+    // Индексы во внутренних циклах всегда в пределах поля: маску блокировок читаем напрямую
+    const size = this.gridSize;
+    const grid = this.grid;
+    const blocked = this.blockedMask;
+
+    for (let col = 0; col < size; col++) {
+      let writeIndex = size - 1;
+
+      for (let row = size - 1; row >= 0; row--) {
+        const index = row * size + col;
+        if (blocked[index] === 1) {
+          grid[index] = null;
           writeIndex = row - 1;
           continue;
         }
 
-        const block = this.grid[row][col];
+        const block = grid[index];
         if (block) {
           if (row !== writeIndex) {
-            this.grid[writeIndex][col] = block;
+            grid[writeIndex * size + col] = block;
             block.row = writeIndex;
-            this.grid[row][col] = null;
+            grid[index] = null;
             this.positionBlockSprite(block);
           }
           writeIndex--;
@@ -548,7 +585,7 @@ export class PuzzleScene extends VerticalBaseScene {
       }
 
       for (let row = writeIndex; row >= 0; row--) {
-        if (this.isCellBlocked(row, col)) {
+        if (blocked[row * size + col] === 1) {
           writeIndex = row - 1;
           continue;
         }
@@ -606,8 +643,7 @@ export class PuzzleScene extends VerticalBaseScene {
     const centerX = this.scale.width / 2;
     const centerY = this.scale.height / 2;
 
-    const overlay = this.add.rectangle(centerX, centerY, this.scale.width, this.scale.height, 0x000000, 0.78);
-    overlay.setScrollFactor(0);
+    const overlay = this.showScreenOverlay(0.78, 0);
 
     const title = success ? 'Миссия выполнена!' : 'Ходы закончились';
     const subtitle = success
@@ -645,7 +681,7 @@ export class PuzzleScene extends VerticalBaseScene {
       .setScrollFactor(0);
 
     continueButton.on('pointerdown', () => {
-      overlay.destroy();
+      overlay.setVisible(false);
       titleText.destroy();
       detailText.destroy();
       continueButton.destroy();
@@ -653,7 +689,12 @@ export class PuzzleScene extends VerticalBaseScene {
     });
   }
 
-  private updateHud(): void {
+  protected onSafeAreaChanged(): void {
+    this.layoutHud();
+  }
+
+  // Позиции HUD зависят только от safeBounds, поэтому пересчитываются на resize, а не при каждом ходе
+  private layoutHud(): void {
     if (!this.targetText || !this.moveText) {
       return;
     }
@@ -669,15 +710,22 @@ export class PuzzleScene extends VerticalBaseScene {
     this.progressBarBg.setPosition(centerX, this.progressBarBg.y);
     this.progressBarFill.setPosition(this.progressBarBg.x - this.progressBarWidth / 2, this.progressBarFill.y);
     this.comboText.setPosition(centerX, this.comboText.y);
+  }
+
+  private updateHud(): void {
+    if (!this.targetText || !this.moveText) {
+      return;
+    }
 
     this.targetText.setText(`Цель: ${this.matches}/${this.targetMatches}`);
     this.moveText.setText(`Ходы: ${this.movesLeft}`);
-    const variantLabel = this.variantMeta?.codename ? ` • ${this.variantMeta.codename}` : '';
     const bonusLabel = this.bonusMessage ? ` • ${this.bonusMessage}` : '';
-    this.comboText.setText(`Комбо x${this.comboMultiplier.toFixed(1)}${variantLabel}${bonusLabel}`);
+    this.comboText.setText(`Комбо x${this.comboMultiplier.toFixed(1)}${this.variantHudLabel}${bonusLabel}`);
 
     const progress = Phaser.Math.Clamp(this.matches / this.targetMatches, 0, 1);
-    this.progressBarFill.setDisplaySize(this.progressBarWidth * progress, this.progressBarBg.displayHeight);
+    if (this.progressBarFill.scaleX !== progress) {
+      this.progressBarFill.scaleX = progress;
+    }
   }
 
   private loadVariantSettings(): void {
@@ -690,15 +738,13 @@ export class PuzzleScene extends VerticalBaseScene {
     const normalized = this.normalizeVariantSource(rawVariant);
 
     this.variantMeta = normalized.meta;
+    this.variantHudLabel = this.variantMeta.codename ? ` • ${this.variantMeta.codename}` : '';
     this.normalizedBlockTypes = normalized.blocks;
-    this.totalSpawnWeight = this.normalizedBlockTypes.reduce((sum, block) => sum + block.spawnWeight, 0);
-    if (this.totalSpawnWeight <= 0) {
-      this.totalSpawnWeight = this.normalizedBlockTypes.length || 1;
-    }
+    this.refreshSpawnWeights();
     this.blockTypeMap = new Map(this.normalizedBlockTypes.map((block) => [block.id, block]));
     this.bonusRules = normalized.bonusRules;
     this.boardModifiersRaw = normalized.boardModifier;
-    this.triggeredBonuses.clear();
+    this.triggeredBonusFlags = new Uint8Array(this.bonusRules.length);
   }
 
   private normalizeVariantSource(
@@ -936,10 +982,9 @@ export class PuzzleScene extends VerticalBaseScene {
     normalized = normalized.replace(/[^a-f0-9]/gi, '');
 
     if (normalized.length === 3) {
-      normalized = normalized
-        .split('')
-        .map((ch) => ch + ch)
-        .join('');
+      // Короткую форму #rgb разворачиваем прямой индексацией, без split/map/join
+      normalized =
+        normalized[0] + normalized[0] + normalized[1] + normalized[1] + normalized[2] + normalized[2];
     }
 
     if (normalized.length !== 6) {
@@ -951,7 +996,8 @@ export class PuzzleScene extends VerticalBaseScene {
   }
 
   private rebuildBoardModifiers(): void {
-    this.blockedCells.clear();
+    this.blockedMask = new Uint8Array(this.gridSize * this.gridSize);
+    this.blockedCellCount = 0;
     if (!this.boardModifiersRaw?.blockedCells || this.boardModifiersRaw.blockedCells.length === 0) {
       return;
     }
@@ -962,7 +1008,11 @@ export class PuzzleScene extends VerticalBaseScene {
       if (row === null || col === null) {
         return;
       }
-      this.blockedCells.add(this.getCellKey(row, col));
+      const index = row * this.gridSize + col;
+      if (this.blockedMask[index] === 0) {
+        this.blockedMask[index] = 1;
+        this.blockedCellCount++;
+      }
     });
   }
 
@@ -977,10 +1027,6 @@ export class PuzzleScene extends VerticalBaseScene {
     return rounded;
   }
 
-  private getCellKey(row: number, col: number): string {
-    return `${row}:${col}`;
-  }
-
   private isWithinBounds(row: number, col: number): boolean {
     return row >= 0 && row < this.gridSize && col >= 0 && col < this.gridSize;
   }
@@ -989,66 +1035,106 @@ export class PuzzleScene extends VerticalBaseScene {
     if (!this.isWithinBounds(row, col)) {
       return true;
     }
-    return this.blockedCells.has(this.getCellKey(row, col));
+    return this.blockedMask[row * this.gridSize + col] === 1;
   }
 
   private renderBoardDecorations(): void {
     this.clearBoardDecorations();
-    if (this.blockedCells.size === 0) {
+    if (this.blockedCellCount === 0) {
       return;
     }
 
-    for (const key of this.blockedCells) {
-      const [rowStr, colStr] = key.split(':');
-      const row = Number(rowStr);
-      const col = Number(colStr);
-      if (!this.isWithinBounds(row, col)) {
-        continue;
+    // Клетка с рамкой отрисована в текстуру один раз: картинки с общей текстурой
+    // уходят одним батчем и не пересобирают геометрию Graphics каждый кадр
+    const textureKey = this.ensureBlockedCellTexture(this.blockSize);
+
+    for (let row = 0; row < this.gridSize; row++) {
+      for (let col = 0; col < this.gridSize; col++) {
+        if (this.blockedMask[row * this.gridSize + col] === 0) {
+          continue;
+        }
+        const { x, y } = this.getBlockPosition(row, col);
+        this.boardDecorations.push(this.add.image(x, y, textureKey).setDepth(-0.5));
       }
-      const { x, y } = this.getBlockPosition(row, col);
-      const obstacle = this.add.rectangle(x, y, this.blockSize, this.blockSize, 0x000000, 0.45);
-      obstacle.setStrokeStyle(2, 0xffffff, 0.12);
-      obstacle.setDepth(-0.5);
-      this.boardDecorations.push(obstacle);
     }
   }
 
+  private ensureBlockedCellTexture(size: number): string {
+    const textureKey = `puzzle_blocked_${size}`;
+    if (!this.textures.exists(textureKey)) {
+      const graphics = this.make.graphics({ x: 0, y: 0, add: false } as Phaser.Types.GameObjects.Graphics.Options);
+      graphics.fillStyle(0x000000, 0.45);
+      graphics.fillRect(0, 0, size, size);
+      graphics.lineStyle(2, 0xffffff, 0.12);
+      graphics.strokeRect(1, 1, size - 2, size - 2);
+      graphics.generateTexture(textureKey, size, size);
+      graphics.destroy();
+    }
+    return textureKey;
+  }
+
   private clearBoardDecorations(): void {
-    this.boardDecorations.forEach((sprite) => sprite.destroy());
+    this.boardDecorations.forEach((decoration) => decoration.destroy());
     this.boardDecorations = [];
   }
 
   private pickBlockType(): NormalizedBlockType {
     if (this.normalizedBlockTypes.length === 0) {
       this.normalizedBlockTypes = this.buildFallbackBlocks();
-      this.totalSpawnWeight = this.normalizedBlockTypes.reduce((sum, block) => sum + block.spawnWeight, 0);
+      this.refreshSpawnWeights();
       this.blockTypeMap = new Map(this.normalizedBlockTypes.map((block) => [block.id, block]));
     }
 
     const roll = Phaser.Math.FloatBetween(0, this.totalSpawnWeight);
-    let accumulator = 0;
-
-    for (const type of this.normalizedBlockTypes) {
-      accumulator += type.spawnWeight;
-      if (roll <= accumulator) {
-        return type;
+    const cumulative = this.spawnWeightCumulative;
+    // Первый тип, у которого накопленный вес не меньше броска
+    let low = 0;
+    let high = cumulative.length - 1;
+    let found = -1;
+    while (low <= high) {
+      const mid = (low + high) >> 1;
+      if (roll <= cumulative[mid]) {
+        found = mid;
+        high = mid - 1;
+      } else {
+        low = mid + 1;
       }
     }
 
-    return this.normalizedBlockTypes[this.normalizedBlockTypes.length - 1];
+    return this.normalizedBlockTypes[found >= 0 ? found : this.normalizedBlockTypes.length - 1];
+  }
+
+  private refreshSpawnWeights(): void {
+    const cumulative: number[] = [];
+    let sum = 0;
+    for (const block of this.normalizedBlockTypes) {
+      sum += block.spawnWeight;
+      cumulative.push(sum);
+    }
+    this.spawnWeightCumulative = cumulative;
+    this.totalSpawnWeight = sum > 0 ? sum : this.normalizedBlockTypes.length || 1;
   }
 
-  private applySpecialBlockEffects(mask: boolean[][]): void {
-    const extraCells: { row: number; col: number }[] = [];
+  private applySpecialBlockEffects(mask: Uint8Array): void {
+    const size = this.gridSize;
+    const cellCount = size * size;
+    if (this.effectMask.length !== cellCount) {
+      this.effectMask = new Uint8Array(cellCount);
+    } else {
+      this.effectMask.fill(0);
+    }
+    const effect = this.effectMask;
+    const blocked = this.blockedMask;
+    let hasEffects = false;
     const colorClears = new Set<string>();
 
-    for (let row = 0; row < this.gridSize; row++) {
-      for (let col = 0; col < this.gridSize; col++) {
-        if (!mask[row][col]) {
+    for (let row = 0; row < size; row++) {
+      for (let col = 0; col < size; col++) {
+        if (!mask[row * size + col]) {
           continue;
         }
 
-        const block = this.grid[row][col];
+        const block = this.grid[row * size + col];
         if (!block?.power) {
           continue;
         }
@@ -1059,23 +1145,32 @@ export class PuzzleScene extends VerticalBaseScene {
               for (let dc = -1; dc <= 1; dc++) {
                 const targetRow = row + dr;
                 const targetCol = col + dc;
-                if (this.isWithinBounds(targetRow, targetCol) && !this.isCellBlocked(targetRow, targetCol)) {
-                  extraCells.push({ row: targetRow, col: targetCol });
+                if (!this.isWithinBounds(targetRow, targetCol)) {
+                  continue;
+                }
+                const index = targetRow * size + targetCol;
+                if (blocked[index] === 0) {
+                  effect[index] = 1;
+                  hasEffects = true;
                 }
               }
             }
             break;
           case 'lineHorizontal':
-            for (let c = 0; c < this.gridSize; c++) {
-              if (!this.isCellBlocked(row, c)) {
-                extraCells.push({ row, col: c });
+            for (let c = 0; c < size; c++) {
+              const index = row * size + c;
+              if (blocked[index] === 0) {
+                effect[index] = 1;
+                hasEffects = true;
               }
             }
             break;
           case 'lineVertical':
-            for (let r = 0; r < this.gridSize; r++) {
-              if (!this.isCellBlocked(r, col)) {
-                extraCells.push({ row: r, col });
+            for (let r = 0; r < size; r++) {
+              const index = r * size + col;
+              if (blocked[index] === 0) {
+                effect[index] = 1;
+                hasEffects = true;
               }
             }
             break;
@@ -1088,19 +1183,20 @@ export class PuzzleScene extends VerticalBaseScene {
       }
     }
 
-    extraCells.forEach(({ row, col }) => {
-      if (this.isWithinBounds(row, col) && !this.isCellBlocked(row, col)) {
-        mask[row][col] = true;
+    // Эффекты вливаются после обхода, чтобы задетые спецблоки не срабатывали цепочкой в этом же проходе
+    if (hasEffects) {
+      for (let index = 0; index < cellCount; index++) {
+        if (effect[index]) {
+          mask[index] = 1;
+        }
       }
-    });
+    }
 
     if (colorClears.size > 0) {
-      for (let row = 0; row < this.gridSize; row++) {
-        for (let col = 0; col < this.gridSize; col++) {
-          const block = this.grid[row][col];
-          if (block && colorClears.has(block.typeId)) {
-            mask[row][col] = true;
-          }
+      for (let index = 0; index < cellCount; index++) {
+        const block = this.grid[index];
+        if (block && colorClears.has(block.typeId)) {
+          mask[index] = 1;
         }
       }
     }
@@ -1111,10 +1207,13 @@ export class PuzzleScene extends VerticalBaseScene {
       return;
     }
 
-    for (const rule of this.bonusRules) {
-      if (this.triggeredBonuses.has(rule.id)) {
+    const rules = this.bonusRules;
+    const triggered = this.triggeredBonusFlags;
+    for (let i = 0; i < rules.length; i++) {
+      if (triggered[i]) {
         continue;
       }
+      const rule = rules[i];
 
       let conditionMet = false;
       switch (rule.triggerType) {
@@ -1132,7 +1231,12 @@ export class PuzzleScene extends VerticalBaseScene {
       }
 
       if (conditionMet) {
-        this.triggeredBonuses.add(rule.id);
+        // Правила с тем же id срабатывают один раз на всех, как и при учёте по id
+        for (let j = i; j < rules.length; j++) {
+          if (rules[j].id === rule.id) {
+            triggered[j] = 1;
+          }
+        }
         this.applyBonusReward(rule);
       }
     }
@@ -1194,10 +1298,8 @@ export class PuzzleScene extends VerticalBaseScene {
     const freeCells: { row: number; col: number }[] = [];
     for (let row = 0; row < this.gridSize; row++) {
       for (let col = 0; col < this.gridSize; col++) {
-        if (this.isCellBlocked(row, col)) {
-          continue;
-        }
-        if (!this.grid[row][col]) {
+        const index = row * this.gridSize + col;
+        if (this.blockedMask[index] === 0 && !this.grid[index]) {
           freeCells.push({ row, col });
         }
       }
@@ -9,6 +9,47 @@ import type {
 
 type MovementInputMode = 'pointer' | 'keyboard';
 
+type WeaponUpgradeBonuses = {
+  damageBonus: number;
+  projectileBonus: number;
+  cooldownMul: number;
+};
+
+// Параметры орбиты лежат прямо в записи, а не в DataManager спрайта: читаются каждый кадр
+type OrbitBullet = {
+  sprite: Phaser.Physics.Arcade.Sprite;
+  radius: number;
+  angle: number;
+  speed: number;
+};
+
+type WeaponUpgrader = (weapon: RoguelikeWeaponProfile, bonuses: WeaponUpgradeBonuses) => void;
+
+const boostWeaponDamage: WeaponUpgrader = (weapon, bonuses) => {
+  weapon.baseDamage *= bonuses.damageBonus;
+};
+
+const boostWeaponProjectiles: WeaponUpgrader = (weapon, bonuses) => {
+  weapon.projectileCount = Phaser.Math.Clamp((weapon.projectileCount ?? 1) + bonuses.projectileBonus, 1, 32);
+};
+
+const boostWeaponCooldown: WeaponUpgrader = (weapon, bonuses) => {
+  weapon.baseCooldownMs = Phaser.Math.Clamp(weapon.baseCooldownMs * bonuses.cooldownMul, 180, 6000);
+};
+
+// Общий случай, если upgradeKind неизвестен — чуть-чуть бустануть всё
+const boostWeaponAll: WeaponUpgrader = (weapon, bonuses) => {
+  boostWeaponDamage(weapon, bonuses);
+  boostWeaponProjectiles(weapon, bonuses);
+  boostWeaponCooldown(weapon, bonuses);
+};
+
+const WEAPON_UPGRADERS: ReadonlyMap<string, WeaponUpgrader> = new Map([
+  ['damage', boostWeaponDamage],
+  ['projectile', boostWeaponProjectiles],
+  ['cooldown', boostWeaponCooldown],
+]);
+
 export class RoguelikeScene extends VerticalBaseScene {
   private player!: Phaser.Physics.Arcade.Sprite;
   private enemies!: Phaser.Physics.Arcade.Group;
@@ -24,19 +65,38 @@ export class RoguelikeScene extends VerticalBaseScene {
   private timerText!: Phaser.GameObjects.Text;
   private challengeText!: Phaser.GameObjects.Text;
   private killText!: Phaser.GameObjects.Text;
+  private lastTimerSecond: number = -1;
+  // Зона, за которой объекты удаляются; пересчитывается раз в кадр в updateCullBounds
+  private cullMinX: number = 0;
+  private cullMaxX: number = 0;
+  private cullMinY: number = 0;
+  private cullMaxY: number = 0;
+  // Ключи текстур пуль по цвету: не собираем строки и не проверяем TextureManager на каждый выстрел
+  private readonly bulletTextureByColor: Map<number, string> = new Map();
+  // Запасная текстура бонуса для каждого профиля: цвет и радиус не меняются между дропами
+  private readonly pickupTextureById: Map<string, string> = new Map();
 
   private movementMode: MovementInputMode = 'pointer';
   private activePointerId?: number;
   private pointerTarget?: Phaser.Math.Vector2;
   private keyboard?: Phaser.Types.Input.Keyboard.CursorKeys;
+  // Рабочие векторы для updateMovement, чтобы не создавать новые каждый кадр
+  private readonly moveTarget = new Phaser.Math.Vector2();
+  private readonly moveDirection = new Phaser.Math.Vector2();
 
   private variant!: RoguelikeVariantSettings;
   private enemyProfiles: RoguelikeEnemyProfile[] = [];
   private pickupProfiles: RoguelikePickupProfile[] = [];
+  // Суммы весов для случайного выбора профилей, считаются один раз в setupVariant
+  private enemySpawnWeightTotal: number = 0;
+  private pickupDropChanceTotal: number = 0;
   private weapon!: RoguelikeWeaponProfile;
+  private weaponsById: Map<string, RoguelikeWeaponProfile> = new Map();
 
   private enemySpawnTimer: number = 0;
   private readonly baseEnemySpawnDelay: number = 1200;
+  // Базовая задержка с учётом плотности из параметров игры, считается один раз в setupVariant
+  private densitySpawnDelay: number = 1200;
 
   // Автоатака
   private weaponCooldown: number = 0;
@@ -44,6 +104,16 @@ export class RoguelikeScene extends VerticalBaseScene {
   private moveSpeedMultiplier: number = 1;
   private maxEnemiesOnScreen: number = 14;
   private activeWeapons: RoguelikeWeaponProfile[] = [];
+  // Ближайший враг для текущего залпа: undefined — ещё не искали, null — врагов нет
+  private salvoClosestEnemy?: Phaser.Physics.Arcade.Sprite | null;
+  // id уже выданных оружий: проверка повторной выдачи без обхода activeWeapons
+  private activeWeaponIds: Set<string> = new Set();
+  // Текущие орбитальные снаряды: без орбитального оружия список пуст и кадр их не трогает
+  private orbitBullets: OrbitBullet[] = [];
+  // Отыгравшие цифры урона: переиспользуем готовые Text вместо создания канваса на каждое попадание
+  private damageTextPool: Phaser.GameObjects.Text[] = [];
+  // Подписи апгрейдов — несколько фиксированных фраз: каждую растеризуем один раз и переиспользуем
+  private upgradeTextByMessage: Map<string, Phaser.GameObjects.Text> = new Map();
 
   initGame(): void {
     this.physics.world.gravity.y = 0;
@@ -61,6 +131,8 @@ export class RoguelikeScene extends VerticalBaseScene {
     this.createGroups();
     this.createPlayer();
     this.createHud();
+    this.damageTextPool = [];
+    this.upgradeTextByMessage = new Map();
     this.registerCollisions();
 
     this.keyboard = this.input.keyboard?.createCursorKeys();
@@ -79,6 +151,7 @@ export class RoguelikeScene extends VerticalBaseScene {
     this.updateMovement(dt);
     this.updateSpawns(time, delta);
     this.updateWeapon(delta);
+    this.updateCullBounds();
     this.updateEnemies(dt);
     this.updateOrbitBullets();
     this.cleanupOffscreen();
@@ -121,18 +194,25 @@ export class RoguelikeScene extends VerticalBaseScene {
     const rawVariant = mechanics.roguelikeVariant as RoguelikeVariantSettings | undefined;
 
     this.variant = this.hydrateVariant(rawVariant);
+
+    const densityParam = Number(this.gameData.config.params?.density ?? 1) || 1;
+    this.densitySpawnDelay = this.baseEnemySpawnDelay / Phaser.Math.Clamp(densityParam, 0.4, 1.6);
     this.enemyProfiles = this.variant.enemyProfiles;
     this.pickupProfiles = this.variant.pickupProfiles;
+    this.enemySpawnWeightTotal = this.enemyProfiles.reduce((sum, e) => sum + e.spawnWeight, 0);
+    this.pickupDropChanceTotal = this.pickupProfiles.reduce((sum, p) => sum + p.dropChance, 0);
+    this.weaponsById = new Map(this.variant.weapons.map((w) => [w.id, w]));
 
     const defaultWeaponId = this.variant.defaultWeaponId ?? this.variant.weapons[0]?.id;
     const weapon =
-      this.variant.weapons.find((w) => w.id === defaultWeaponId) ?? this.variant.weapons[0];
+      (defaultWeaponId ? this.weaponsById.get(defaultWeaponId) : undefined) ?? this.variant.weapons[0];
     if (!weapon) {
       throw new Error('RoguelikeVariantSettings: no weapons defined');
     }
     this.weapon = weapon;
     this.applyPlayerConstraints();
     this.activeWeapons = [this.weapon];
+    this.activeWeaponIds = new Set([this.weapon.id]);
   }
 
   private hydrateVariant(incoming?: RoguelikeVariantSettings): RoguelikeVariantSettings {
@@ -636,6 +716,7 @@ export class RoguelikeScene extends VerticalBaseScene {
       .setScrollFactor(0)
       .setDepth(5);
 
+    this.lastTimerSecond = -1;
     this.updateHpLabel();
     this.updateKillLabel();
     this.updateTimerLabel();
@@ -672,11 +753,11 @@ export class RoguelikeScene extends VerticalBaseScene {
     const speed = speedBase * this.moveSpeedMultiplier;
 
     if (this.movementMode === 'pointer' && this.pointerTarget) {
-      const target = new Phaser.Math.Vector2(
+      const target = this.moveTarget.set(
         Phaser.Math.Clamp(this.pointerTarget.x, this.safeBounds.left, this.safeBounds.right),
         Phaser.Math.Clamp(this.pointerTarget.y, this.safeBounds.top, this.safeBounds.bottom),
       );
-      const dir = target.clone().subtract(this.player).normalize();
+      const dir = this.moveDirection.copy(target).subtract(this.player).normalize();
       const dist = Phaser.Math.Distance.Between(this.player.x, this.player.y, target.x, target.y);
       const move = Math.min(dist, speed * dt);
       this.player.x += dir.x * move;
@@ -691,7 +772,7 @@ export class RoguelikeScene extends VerticalBaseScene {
       const y =
         (this.keyboard.up?.isDown ? -1 : 0) +
         (this.keyboard.down?.isDown ? 1 : 0);
-      const dir = new Phaser.Math.Vector2(x, y);
+      const dir = this.moveDirection.set(x, y);
       if (dir.lengthSq() > 0) {
         dir.normalize();
         this.player.x = Phaser.Math.Clamp(
@@ -709,20 +790,15 @@ export class RoguelikeScene extends VerticalBaseScene {
   }
 
   private updateSpawns(time: number, delta: number): void {
-    const densityParam = Number(this.gameData.config.params?.density ?? 1) || 1;
-    const density = Phaser.Math.Clamp(densityParam, 0.4, 1.6);
-
-    const baseDelay = this.baseEnemySpawnDelay / density;
-    const t = this.timeElapsed;
-    // Рост сложности более мягкий и с меньшим максимумом
-    const difficultyMul = Phaser.Math.Clamp(1 + t / 180, 1, 2); // растет каждые 3 минуты
-    const delay = baseDelay / difficultyMul;
-
     this.enemySpawnTimer -= delta;
-    if (this.enemySpawnTimer <= 0) {
-      this.spawnEnemyWave();
-      this.enemySpawnTimer = delay;
+    if (this.enemySpawnTimer > 0) {
+      return;
     }
+
+    // Рост сложности более мягкий и с меньшим максимумом
+    const difficultyMul = Phaser.Math.Clamp(1 + this.timeElapsed / 180, 1, 2); // растет каждые 3 минуты
+    this.spawnEnemyWave();
+    this.enemySpawnTimer = this.densitySpawnDelay / difficultyMul;
   }
 
   private spawnEnemyWave(): void {
@@ -745,7 +821,7 @@ export class RoguelikeScene extends VerticalBaseScene {
 
   private pickEnemyProfile(): RoguelikeEnemyProfile {
     const pool = this.enemyProfiles;
-    const total = pool.reduce((sum, e) => sum + e.spawnWeight, 0);
+    const total = this.enemySpawnWeightTotal;
     let roll = Math.random() * (total || pool.length);
     for (const e of pool) {
       roll -= e.spawnWeight;
@@ -814,90 +890,103 @@ export class RoguelikeScene extends VerticalBaseScene {
     const playerX = this.player.x;
     const playerY = this.player.y;
 
-    this.enemies.getChildren().forEach((child) => {
+    // Движение и удаление ушедших за край врагов — один проход; обходим копию, т.к. destroy меняет группу
+    this.enemies.getChildren().slice().forEach((child) => {
       const enemy = child as Phaser.Physics.Arcade.Sprite;
       if (!enemy.active) return;
+      this.moveEnemy(enemy, dt, playerX, playerY);
+      if (this.isOutsideCullBounds(enemy)) {
+        enemy.destroy();
+      }
+    });
+  }
 
-      const pattern = enemy.getData('pattern') as RoguelikeEnemyProfile['pattern'];
-      const speed = (enemy.getData('speed') as number) || 60;
-      const state = (enemy.getData('state') as string) || 'idle';
-
-      const toPlayer = new Phaser.Math.Vector2(playerX - enemy.x, playerY - enemy.y);
-      const dist = toPlayer.length();
-      const dir = dist > 0 ? toPlayer.clone().scale(1 / dist) : new Phaser.Math.Vector2(0, 0);
-
-      switch (pattern) {
-        case 'chaser': {
-          const move = speed * dt;
-          enemy.x += dir.x * move;
-          enemy.y += dir.y * move;
-          break;
-        }
-        case 'orbiter': {
-          // Держится на среднем расстоянии и кружит
-          const desiredRadius = 120;
-          const orbitSeed = (enemy.getData('orbitSeed') as number) || 0;
-          const angle = this.timeElapsed * 0.8 + orbitSeed;
-          const radialDir = new Phaser.Math.Vector2(
-            Math.cos(angle),
-            Math.sin(angle),
-          );
-
-          // Подтягиваемся к окружности вокруг игрока
-          const currentRadius = dist;
-          const radiusError = desiredRadius - currentRadius;
-          const radialAdjust = Phaser.Math.Clamp(radiusError, -1, 1) * speed * 0.5 * dt;
-
-          enemy.x += radialDir.x * radialAdjust;
-          enemy.y += radialDir.y * radialAdjust;
-          break;
-        }
-        case 'charger': {
-          const now = this.time.now;
-          const nextActionAt = (enemy.getData('nextActionAt') as number) || 0;
-
-          if (state === 'charging') {
-            const move = speed * 1.6 * dt;
-            enemy.x += dir.x * move;
-            enemy.y += dir.y * move;
-            if (now >= nextActionAt) {
-              enemy.setData('state', 'idle');
-              enemy.setData('nextActionAt', now + Phaser.Math.Between(1000, 2200));
-            }
-          } else if (now >= nextActionAt) {
-            enemy.setData('state', 'charging');
-            enemy.setData('nextActionAt', now + Phaser.Math.Between(260, 480));
-          } else {
-            // медленное подползание
-            const move = speed * 0.4 * dt;
-            enemy.x += dir.x * move;
-            enemy.y += dir.y * move;
+  private moveEnemy(enemy: Phaser.Physics.Arcade.Sprite, dt: number, playerX: number, playerY: number): void {
+    // Читаем хранилище данных врага один раз вместо серии getData на каждое поле
+    const data = (enemy.data?.list ?? {}) as Record<string, unknown>;
+    const pattern = data.pattern as RoguelikeEnemyProfile['pattern'];
+    const speed = (data.speed as number) || 60;
+    const state = (data.state as string) || 'idle';
+
+    // Направление к игроку считаем скалярами: без Vector2 на каждого врага в каждом кадре
+    const dx = playerX - enemy.x;
+    const dy = playerY - enemy.y;
+    const dist = Math.sqrt(dx * dx + dy * dy);
+    const invDist = dist > 0 ? 1 / dist : 0;
+    const dirX = dx * invDist;
+    const dirY = dy * invDist;
+
+    switch (pattern) {
+      case 'chaser': {
+        const move = speed * dt;
+        enemy.x += dirX * move;
+        enemy.y += dirY * move;
+        break;
+      }
+      case 'orbiter': {
+        // Держится на среднем расстоянии и кружит
+        const desiredRadius = 120;
+        const orbitSeed = (data.orbitSeed as number) || 0;
+        const angle = this.timeElapsed * 0.8 + orbitSeed;
+
+        // Подтягиваемся к окружности вокруг игрока
+        const currentRadius = dist;
+        const radiusError = desiredRadius - currentRadius;
+        const radialAdjust = Phaser.Math.Clamp(radiusError, -1, 1) * speed * 0.5 * dt;
+
+        enemy.x += Math.cos(angle) * radialAdjust;
+        enemy.y += Math.sin(angle) * radialAdjust;
+        break;
+      }
+      case 'charger': {
+        const now = this.time.now;
+        const nextActionAt = (data.nextActionAt as number) || 0;
+
+        if (state === 'charging') {
+          const move = speed * 1.6 * dt;
+          enemy.x += dirX * move;
+          enemy.y += dirY * move;
+          if (now >= nextActionAt) {
+            enemy.setData('state', 'idle');
+            enemy.setData('nextActionAt', now + Phaser.Math.Between(1000, 2200));
           }
-          break;
+        } else if (now >= nextActionAt) {
+          enemy.setData('state', 'charging');
+          enemy.setData('nextActionAt', now + Phaser.Math.Between(260, 480));
+        } else {
+          // медленное подползание
+          const move = speed * 0.4 * dt;
+          enemy.x += dirX * move;
+          enemy.y += dirY * move;
         }
-        case 'ranged':
-        default: {
-          // Держим дистанцию: если далеко — подтягиваемся, если близко — отпрыгиваем
-          const minDist = 140;
-          const maxDist = 220;
-          let moveDir = new Phaser.Math.Vector2(0, 0);
-
-          if (dist > maxDist) {
-            moveDir = dir;
-          } else if (dist < minDist) {
-            moveDir = dir.clone().scale(-1);
-          } else {
-            // боковое смещение по окружности
-            moveDir = new Phaser.Math.Vector2(-dir.y, dir.x);
-          }
-
-          const move = speed * 0.9 * dt;
-          enemy.x += moveDir.x * move;
-          enemy.y += moveDir.y * move;
-          break;
+        break;
+      }
+      case 'ranged':
+      default: {
+        // Держим дистанцию: если далеко — подтягиваемся, если близко — отпрыгиваем
+        const minDist = 140;
+        const maxDist = 220;
+        let moveX = 0;
+        let moveY = 0;
+
+        if (dist > maxDist) {
+          moveX = dirX;
+          moveY = dirY;
+        } else if (dist < minDist) {
+          moveX = -dirX;
+          moveY = -dirY;
+        } else {
+          // боковое смещение по окружности
+          moveX = -dirY;
+          moveY = dirX;
         }
+
+        const move = speed * 0.9 * dt;
+        enemy.x += moveX * move;
+        enemy.y += moveY * move;
+        break;
       }
-    });
+    }
   }
 
   private updateWeapon(delta: number): void {
@@ -913,7 +1002,10 @@ export class RoguelikeScene extends VerticalBaseScene {
 
   private fireWeaponsSalvo(): void {
     if (!this.activeWeapons.length) return;
+    // Во время залпа враги не двигаются, поэтому ближайшего ищем один раз на все оружия
+    this.salvoClosestEnemy = undefined;
     this.activeWeapons.forEach((weapon) => this.fireWeaponInstance(weapon));
+    this.salvoClosestEnemy = undefined;
   }
 
   private fireWeaponInstance(weapon: RoguelikeWeaponProfile): void {
@@ -940,12 +1032,8 @@ export class RoguelikeScene extends VerticalBaseScene {
     const color = 0xfff176;
 
     // Удаляем старые орбитальные снаряды, чтобы не захламлять сцену
-    this.bullets.getChildren().forEach((child) => {
-      const b = child as Phaser.Physics.Arcade.Sprite;
-      if (b.getData('orbit')) {
-        b.destroy();
-      }
-    });
+    this.orbitBullets.forEach((b) => b.sprite.destroy());
+    this.orbitBullets = [];
 
     for (let i = 0; i < count; i++) {
       const angle = (Math.PI * 2 * i) / count + this.timeElapsed;
@@ -953,10 +1041,7 @@ export class RoguelikeScene extends VerticalBaseScene {
       const y = this.player.y + Math.sin(angle) * radius;
       const bullet = this.createBullet(x, y, 0, 0, color);
       bullet.setData('damage', damage);
-      bullet.setData('orbit', true);
-      bullet.setData('orbitRadius', radius);
-      bullet.setData('orbitAngle', angle);
-      bullet.setData('orbitSpeed', 1);
+      this.orbitBullets.push({ sprite: bullet, radius, angle, speed: 1 });
     }
   }
 
@@ -1004,19 +1089,27 @@ export class RoguelikeScene extends VerticalBaseScene {
     const maxTargets = weapon.chainTargets ?? 4;
     const damage = weapon.baseDamage;
 
+    // Кандидатов собираем один раз; поражённые цели вынимаем обменом с последним элементом,
+    // поэтому каждый следующий прыжок смотрит только на ещё не задетых врагов
+    const candidates: Phaser.Physics.Arcade.Sprite[] = [];
+    this.enemies.getChildren().forEach((child) => {
+      const enemy = child as Phaser.Physics.Arcade.Sprite;
+      if (enemy.active && enemy !== first) {
+        candidates.push(enemy);
+      }
+    });
+
     let current: Phaser.Physics.Arcade.Sprite | null = first;
-    const visited = new Set<Phaser.Physics.Arcade.Sprite>();
     const chainColor = 0xb39ddb;
 
     for (let i = 0; i < maxTargets && current; i++) {
       const chainTarget = current;
-      visited.add(chainTarget);
       const bullet = this.createBullet(this.player.x, this.player.y, 0, 0, chainColor);
       bullet.setData('damage', damage);
       bullet.setData('instantHit', true);
       bullet.setData('target', chainTarget);
 
-      current = this.findNextChainTarget(chainTarget, visited);
+      current = this.takeNextChainTarget(chainTarget, candidates);
     }
   }
 
@@ -1027,7 +1120,11 @@ export class RoguelikeScene extends VerticalBaseScene {
     vy: number,
     color: number,
   ): Phaser.Physics.Arcade.Sprite {
-    const texture = this.ensureCircleTexture(`rogue_bullet_${color.toString(16)}`, 4, color);
+    let texture = this.bulletTextureByColor.get(color);
+    if (!texture) {
+      texture = this.ensureCircleTexture(`rogue_bullet_${color.toString(16)}`, 4, color);
+      this.bulletTextureByColor.set(color, texture);
+    }
     const bullet = (this.bullets as Phaser.Physics.Arcade.Group).create(
       x,
       y,
@@ -1040,17 +1137,14 @@ export class RoguelikeScene extends VerticalBaseScene {
   }
 
   private updateOrbitBullets(): void {
-    const bullets = this.bullets.getChildren() as Phaser.Physics.Arcade.Sprite[];
-    if (!bullets.length) return;
+    if (!this.orbitBullets.length) return;
 
-    bullets.forEach((bullet) => {
+    this.orbitBullets.forEach((orbit) => {
+      const bullet = orbit.sprite;
       if (!bullet.active) return;
-      if (!bullet.getData('orbit')) return;
 
-      const radius = (bullet.getData('orbitRadius') as number) || 60;
-      const baseAngle = (bullet.getData('orbitAngle') as number) || 0;
-      const speed = (bullet.getData('orbitSpeed') as number) || 1;
-      const angle = baseAngle + this.timeElapsed * speed;
+      const radius = orbit.radius || 60;
+      const angle = orbit.angle + this.timeElapsed * orbit.speed;
 
       bullet.x = this.player.x + Math.cos(angle) * radius;
       bullet.y = this.player.y + Math.sin(angle) * radius;
@@ -1058,39 +1152,50 @@ export class RoguelikeScene extends VerticalBaseScene {
   }
 
   private findClosestEnemy(): Phaser.Physics.Arcade.Sprite | null {
+    if (this.salvoClosestEnemy !== undefined) {
+      return this.salvoClosestEnemy;
+    }
     let best: Phaser.Physics.Arcade.Sprite | null = null;
     let bestDistSq = Number.POSITIVE_INFINITY;
+    const playerX = this.player.x;
+    const playerY = this.player.y;
     this.enemies.getChildren().forEach((child) => {
       const enemy = child as Phaser.Physics.Arcade.Sprite;
       if (!enemy.active) return;
-      const dx = enemy.x - this.player.x;
-      const dy = enemy.y - this.player.y;
+      const dx = enemy.x - playerX;
+      const dy = enemy.y - playerY;
       const distSq = dx * dx + dy * dy;
       if (distSq < bestDistSq) {
         bestDistSq = distSq;
         best = enemy;
       }
     });
+    this.salvoClosestEnemy = best;
     return best;
   }
 
-  private findNextChainTarget(
+  private takeNextChainTarget(
     from: Phaser.Physics.Arcade.Sprite,
-    visited: Set<Phaser.Physics.Arcade.Sprite>,
+    candidates: Phaser.Physics.Arcade.Sprite[],
   ): Phaser.Physics.Arcade.Sprite | null {
-    let best: Phaser.Physics.Arcade.Sprite | null = null;
-    let bestDistSq = Number.POSITIVE_INFINITY;
-    this.enemies.getChildren().forEach((child) => {
-      const enemy = child as Phaser.Physics.Arcade.Sprite;
-      if (!enemy.active || visited.has(enemy)) return;
+    let bestIndex = -1;
+    let bestDistSq = 180 * 180;
+    for (let i = 0; i < candidates.length; i++) {
+      const enemy = candidates[i];
       const dx = enemy.x - from.x;
       const dy = enemy.y - from.y;
       const distSq = dx * dx + dy * dy;
-      if (distSq < bestDistSq && distSq < 180 * 180) {
+      if (distSq < bestDistSq) {
         bestDistSq = distSq;
-        best = enemy;
+        bestIndex = i;
       }
-    });
+    }
+    if (bestIndex < 0) {
+      return null;
+    }
+    const best = candidates[bestIndex];
+    candidates[bestIndex] = candidates[candidates.length - 1];
+    candidates.pop();
     return best;
   }
 
@@ -1101,19 +1206,22 @@ export class RoguelikeScene extends VerticalBaseScene {
     if (!(bullet instanceof Phaser.Physics.Arcade.Sprite)) return;
     if (!(enemy instanceof Phaser.Physics.Arcade.Sprite)) return;
 
-    const damage = (bullet.getData('damage') as number) || this.weapon.baseDamage;
-    const instant = bullet.getData('instantHit') === true;
+    // Самый частый путь боя: читаем данные пули и врага напрямую из списка DataManager
+    const bulletData = bullet.data.list as { damage?: number; instantHit?: boolean };
+    const damage = bulletData.damage || this.weapon.baseDamage;
+    const instant = bulletData.instantHit === true;
 
     if (!instant) {
       bullet.destroy();
     }
 
-    const shieldUntil = enemy.getData('shieldUntil') as number | undefined;
+    const enemyData = enemy.data.list as { hp?: number; shieldUntil?: number };
+    const shieldUntil = enemyData.shieldUntil;
     if (shieldUntil && this.time.now < shieldUntil) {
       return;
     }
 
-    let hp = (enemy.getData('hp') as number) ?? 1;
+    let hp = enemyData.hp ?? 1;
     hp -= damage;
     this.showDamageNumber(enemy.x, enemy.y, damage);
     if (hp <= 0) {
@@ -1152,7 +1260,8 @@ export class RoguelikeScene extends VerticalBaseScene {
     const amount = profile.amount ?? 1;
     switch (profile.type) {
       case 'heal':
-        this.health = Phaser.Math.Clamp(this.health + amount, 0, this.maxHealth);
+        // amount после гидрации не меньше 1, поэтому нижняя граница не нужна
+        this.health = Math.min(this.maxHealth, this.health + amount);
         this.updateHpLabel();
         break;
       case 'xp':
@@ -1188,23 +1297,32 @@ export class RoguelikeScene extends VerticalBaseScene {
       this.getLlmTextureKey({ id: profile.id }) ??
       this.getLlmTextureKey({ role: 'bonus', random: true });
 
-    const isUpgrade = profile.type === 'weaponUpgrade';
-    const color = isUpgrade ? 0xffa726 : profile.type === 'heal' ? 0x81c784 : 0xfff176;
-    const radius = isUpgrade || profile.rare ? 9 : 6;
-
-    const texture =
-      llmTexture ?? this.ensureCircleTexture(`rogue_pickup_${profile.id}`, radius, color);
+    const highlighted = profile.type === 'weaponUpgrade' || profile.rare;
+    const texture = llmTexture ?? this.getPickupFallbackTexture(profile);
 
     const pickup = this.pickups.create(x, y, texture) as Phaser.Physics.Arcade.Sprite;
     this.disableGravity(pickup);
-    pickup.setDepth(isUpgrade || profile.rare ? 3 : 1);
+    pickup.setDepth(highlighted ? 3 : 1);
     pickup.setVelocity(0, 22);
     pickup.setData('profile', profile);
   }
 
+  private getPickupFallbackTexture(profile: RoguelikePickupProfile): string {
+    const cached = this.pickupTextureById.get(profile.id);
+    if (cached) {
+      return cached;
+    }
+    const isUpgrade = profile.type === 'weaponUpgrade';
+    const color = isUpgrade ? 0xffa726 : profile.type === 'heal' ? 0x81c784 : 0xfff176;
+    const radius = isUpgrade || profile.rare ? 9 : 6;
+    const texture = this.ensureCircleTexture(`rogue_pickup_${profile.id}`, radius, color);
+    this.pickupTextureById.set(profile.id, texture);
+    return texture;
+  }
+
   private pickPickupProfile(): RoguelikePickupProfile | undefined {
     if (this.pickupProfiles.length === 0) return undefined;
-    const total = this.pickupProfiles.reduce((sum, p) => sum + p.dropChance, 0);
+    const total = this.pickupDropChanceTotal;
     let roll = Math.random() * (total || this.pickupProfiles.length);
     for (const p of this.pickupProfiles) {
       roll -= p.dropChance;
@@ -1229,42 +1347,60 @@ export class RoguelikeScene extends VerticalBaseScene {
   private showUpgradeText(message: string): void {
     const x = this.player.x;
     const y = this.player.y - 30;
-    const text = this.add.text(x, y, message, {
-      fontSize: '16px',
-      color: '#ffe082',
-      fontFamily: 'Arial',
-      stroke: '#000000',
-      strokeThickness: 2,
-    });
-    text.setOrigin(0.5);
-    text.setDepth(20);
+    let text = this.upgradeTextByMessage.get(message);
+    if (text) {
+      this.tweens.killTweensOf(text);
+      text.setPosition(x, y).setAlpha(1).setVisible(true);
+    } else {
+      text = this.add.text(x, y, message, {
+        fontSize: '16px',
+        color: '#ffe082',
+        fontFamily: 'Arial',
+        stroke: '#000000',
+        strokeThickness: 2,
+      });
+      text.setOrigin(0.5);
+      text.setDepth(20);
+      this.upgradeTextByMessage.set(message, text);
+    }
+    const shown = text;
     this.tweens.add({
-      targets: text,
+      targets: shown,
       y: y - 24,
       alpha: 0,
       duration: 700,
       ease: 'Cubic.easeOut',
-      onComplete: () => text.destroy(),
+      onComplete: () => shown.setVisible(false),
     });
   }
 
   private showDamageNumber(x: number, y: number, amount: number): void {
-    const text = this.add.text(x, y, `${Math.max(1, Math.round(amount))}`, {
-      fontSize: '14px',
-      color: '#ffeb3b',
-      fontFamily: 'Arial',
-      stroke: '#000000',
-      strokeThickness: 2,
-    });
-    text.setOrigin(0.5);
-    text.setDepth(19);
+    const label = `${Math.max(1, Math.round(amount))}`;
+    let text = this.damageTextPool.pop();
+    if (text) {
+      text.setPosition(x, y).setText(label).setAlpha(1).setVisible(true);
+    } else {
+      text = this.add.text(x, y, label, {
+        fontSize: '14px',
+        color: '#ffeb3b',
+        fontFamily: 'Arial',
+        stroke: '#000000',
+        strokeThickness: 2,
+      });
+      text.setOrigin(0.5);
+      text.setDepth(19);
+    }
+    const pooled = text;
     this.tweens.add({
-      targets: text,
+      targets: pooled,
       y: y - 20,
       alpha: 0,
       duration: 450,
       ease: 'Cubic.easeOut',
-      onComplete: () => text.destroy(),
+      onComplete: () => {
+        pooled.setVisible(false);
+        this.damageTextPool.push(pooled);
+      },
     });
   }
 
@@ -1272,6 +1408,7 @@ export class RoguelikeScene extends VerticalBaseScene {
     if (!this.activeWeapons.length) {
       if (this.weapon) {
         this.activeWeapons = [this.weapon];
+        this.activeWeaponIds = new Set([this.weapon.id]);
       } else {
         return;
       }
@@ -1282,55 +1419,28 @@ export class RoguelikeScene extends VerticalBaseScene {
     if (kind === 'grantWeapon') {
       const id = profile.grantWeaponId;
       if (!id) return;
-      const weapon = this.variant.weapons.find((w) => w.id === id);
+      const weapon = this.weaponsById.get(id);
       if (!weapon) return;
-      const alreadyActive = this.activeWeapons.some((w) => w.id === id);
-      if (!alreadyActive) {
+      if (!this.activeWeaponIds.has(id)) {
         this.activeWeapons.push({ ...weapon });
+        this.activeWeaponIds.add(id);
       }
       this.showUpgradeText('Новое оружие!');
       return;
     }
 
     // Усиливаем все активные оружия (чуть-чуть, чтобы не ломать баланс)
-    const damageBonus = profile.damageBonus ?? 1.2;
-    const projectileBonus = profile.projectileBonus ?? 1;
-    const cooldownMul = profile.cooldownMultiplier ?? 0.9;
+    const bonuses: WeaponUpgradeBonuses = {
+      damageBonus: profile.damageBonus ?? 1.2,
+      projectileBonus: profile.projectileBonus ?? 1,
+      cooldownMul: profile.cooldownMultiplier ?? 0.9,
+    };
+    // Обработчик выбираем по таблице один раз, а не сравниваем kind заново для каждого оружия
+    const upgrade = WEAPON_UPGRADERS.get(kind) ?? boostWeaponAll;
 
     this.activeWeapons = this.activeWeapons.map((weapon) => {
       const upgraded: RoguelikeWeaponProfile = { ...weapon };
-      if (kind === 'damage' || kind === 'projectile' || kind === 'cooldown') {
-        if (kind === 'damage') {
-          upgraded.baseDamage *= damageBonus;
-        }
-        if (kind === 'projectile') {
-          upgraded.projectileCount = Phaser.Math.Clamp(
-            (upgraded.projectileCount ?? 1) + projectileBonus,
-            1,
-            32,
-          );
-        }
-        if (kind === 'cooldown') {
-          upgraded.baseCooldownMs = Phaser.Math.Clamp(
-            upgraded.baseCooldownMs * cooldownMul,
-            180,
-            6000,
-          );
-        }
-      } else {
-        // Общий случай, если upgradeKind неизвестен — чуть-чуть бустануть всё
-        upgraded.baseDamage *= damageBonus;
-        upgraded.projectileCount = Phaser.Math.Clamp(
-          (upgraded.projectileCount ?? 1) + projectileBonus,
-          1,
-          32,
-        );
-        upgraded.baseCooldownMs = Phaser.Math.Clamp(
-          upgraded.baseCooldownMs * cooldownMul,
-          180,
-          6000,
-        );
-      }
+      upgrade(upgraded, bonuses);
       return upgraded;
     });
 
@@ -1387,6 +1497,9 @@ export class RoguelikeScene extends VerticalBaseScene {
   private updateTimerLabel(): void {
     if (!this.timerText) return;
     const totalSeconds = Math.floor(this.timeElapsed);
+    // Таймер вызывается каждый кадр, а текст меняется раз в секунду — не пересобираем строку зря
+    if (totalSeconds === this.lastTimerSecond) return;
+    this.lastTimerSecond = totalSeconds;
     const minutes = Math.floor(totalSeconds / 60);
     const seconds = totalSeconds % 60;
     this.timerText.setText(
@@ -1394,31 +1507,31 @@ export class RoguelikeScene extends VerticalBaseScene {
     );
   }
 
-  private cleanupOffscreen(): void {
-    const bounds = new Phaser.Geom.Rectangle(
-      this.safeBounds.left - 80,
-      this.safeBounds.top - 80,
-      this.safeBounds.width + 160,
-      this.safeBounds.height + 160,
-    );
+  private updateCullBounds(): void {
+    // Границы зоны очистки — четыре числа на кадр; проверка объекта сводится к четырём сравнениям
+    this.cullMinX = this.safeBounds.left - 80;
+    this.cullMaxX = this.safeBounds.right + 80;
+    this.cullMinY = this.safeBounds.top - 80;
+    this.cullMaxY = this.safeBounds.bottom + 80;
+  }
 
-    this.enemies.getChildren().forEach((child) => {
-      const e = child as Phaser.Physics.Arcade.Sprite;
-      if (!bounds.contains(e.x, e.y)) {
-        e.destroy();
-      }
-    });
+  private isOutsideCullBounds(obj: Phaser.Physics.Arcade.Sprite): boolean {
+    return obj.x < this.cullMinX || obj.x > this.cullMaxX || obj.y < this.cullMinY || obj.y > this.cullMaxY;
+  }
 
-    (this.bullets as Phaser.Physics.Arcade.Group).getChildren().forEach((child) => {
+  private cleanupOffscreen(): void {
+    // Враги отсекаются прямо в updateEnemies; здесь остаются пули и бонусы.
+    // Обходим копии: destroy удаляет объект из группы прямо во время обхода
+    (this.bullets as Phaser.Physics.Arcade.Group).getChildren().slice().forEach((child) => {
       const b = child as Phaser.Physics.Arcade.Sprite;
-      if (!bounds.contains(b.x, b.y)) {
+      if (this.isOutsideCullBounds(b)) {
         b.destroy();
       }
     });
 
-    this.pickups.getChildren().forEach((child) => {
+    this.pickups.getChildren().slice().forEach((child) => {
       const p = child as Phaser.Physics.Arcade.Sprite;
-      if (!bounds.contains(p.x, p.y)) {
+      if (this.isOutsideCullBounds(p)) {
         p.destroy();
       }
     });
@@ -1455,19 +1568,16 @@ export class RoguelikeScene extends VerticalBaseScene {
     if (this.gameEnded) return;
     this.gameEnded = true;
 
+    // Под затемнением поле уже не видно: останавливаем физику и прячем HUD,
+    // чтобы не считать коллизии и не рисовать тексты под оверлеем.
+    // Значения HUD всё равно дублируются в итоговой сводке ниже.
+    this.physics.pause();
+    [this.hpText, this.timerText, this.killText, this.challengeText].forEach((text) => text?.setVisible(false));
+
     const centerX = this.scale.width / 2;
     const centerY = this.scale.height / 2;
 
-    const overlay = this.add.rectangle(
-      centerX,
-      centerY,
-      this.scale.width,
-      this.scale.height,
-      0x000000,
-      0.8,
-    );
-    overlay.setScrollFactor(0);
-    overlay.setDepth(10);
+    this.showScreenOverlay(0.8);
 
     const title = this.add
       .text(centerX, centerY - 60, success ? 'Челлендж выполнен!' : 'Вы погибли', {
@@ -30,12 +30,25 @@ type WaveDefinition = {
   groups: { enemyId: string; count: number }[];
 };
 
+// Характеристики врага для конкретной волны: считаются один раз на группу, а не на каждого врага
+type EnemySpawnStats = {
+  definition: EnemyDefinition;
+  health: number;
+  reward: number;
+  speed: number;
+  // Роль для случайного LLM-спрайта и спрайт по id (если есть) тоже не меняются внутри группы
+  llmRole: 'boss' | 'enemy';
+  llmTextureById?: string;
+  fallbackTexture?: string;
+};
+
 type TowerInstance = {
   position: Phaser.Math.Vector2;
   definition: TowerDefinition;
   sprite: Phaser.GameObjects.Image;
   label: Phaser.GameObjects.Text;
   cooldown: number;
+  reloadMs: number;
 };
 
 export class TowerDefenseScene extends BaseGameScene {
@@ -46,6 +59,18 @@ export class TowerDefenseScene extends BaseGameScene {
   private projectiles!: Phaser.Physics.Arcade.Group;
   private towerDefinitions: TowerDefinition[] = [];
   private enemyMap: Map<string, EnemyDefinition> = new Map();
+  private bossEnemyIds: Set<string> = new Set();
+  // Снимок врагов на кадр: координаты и прогресс по пути читаются один раз, а не для каждой башни
+  private targetEnemies: Phaser.Physics.Arcade.Sprite[] = [];
+  private targetXs: number[] = [];
+  private targetYs: number[] = [];
+  private targetProgress: number[] = [];
+  // Равномерная сетка поверх снимка: башня проверяет только клетки, которые задевает её радиус
+  private readonly targetCellSize = 128;
+  private targetCellCols = 1;
+  private targetCellRows = 1;
+  private targetCellHead: Int32Array = new Int32Array(0);
+  private targetNextInCell: number[] = [];
   private waveDefinitions: WaveDefinition[] = [];
   private requestedWaves = 5;
   private requestedTowerSlots = 6;
@@ -55,10 +80,12 @@ export class TowerDefenseScene extends BaseGameScene {
   private waveText!: Phaser.GameObjects.Text;
   private creditsText!: Phaser.GameObjects.Text;
   private credits = 0;
+  private renderedCredits = 0;
   private wavesStarted = 0;
   private allWavesScheduled = false;
   private waveTimer?: Phaser.Time.TimerEvent;
-  private activeSpawners: Phaser.Time.TimerEvent[] = [];
+  // Set: завершившийся спавнер удаляется за O(1), без пересборки массива
+  private activeSpawners: Set<Phaser.Time.TimerEvent> = new Set();
   private readonly defaultPalette = [0x10182b, 0x1f2d45, 0x34506e, 0x4caf50, 0xffc048];
   private theme = {
     background: 0x10182b,
@@ -72,9 +99,14 @@ export class TowerDefenseScene extends BaseGameScene {
   protected initGame(): void {
     this.parseParams();
     this.applyVisualTheme();
-    this.towerDefinitions = this.extractTowerDefinitions();
-    this.enemyMap = this.extractEnemyDefinitions();
-    this.waveDefinitions = this.extractWaveDefinitions();
+    const mechanics = this.getMechanicsRecord();
+    this.towerDefinitions = this.extractTowerDefinitions(mechanics);
+    this.enemyMap = this.extractEnemyDefinitions(mechanics);
+    // Признак босса зависит только от id, поэтому считаем его один раз, а не при каждом спавне
+    this.bossEnemyIds = new Set(
+      Array.from(this.enemyMap.keys()).filter((id) => id.toLowerCase().includes('boss')),
+    );
+    this.waveDefinitions = this.extractWaveDefinitions(mechanics);
 
     this.enemies = this.physics.add.group({ classType: Phaser.Physics.Arcade.Sprite, runChildUpdate: false });
     this.projectiles = this.physics.add.group({ classType: Phaser.Physics.Arcade.Image, runChildUpdate: false });
@@ -99,45 +131,52 @@ export class TowerDefenseScene extends BaseGameScene {
       return;
     }
 
-    this.enemies.getChildren().forEach((child) => {
+    // Копия списка: прорвавшийся к базе враг уничтожается прямо во время обхода
+    this.enemies.getChildren().slice().forEach((child) => {
       const enemy = child as Phaser.Physics.Arcade.Sprite;
       this.advanceEnemy(enemy);
     });
 
+    let targetCount = -1;
     this.towers.forEach((tower) => {
       if (tower.cooldown > 0) {
         tower.cooldown -= delta;
       }
-      const target = this.findTargetForTower(tower);
+      // Пока башня перезаряжается, цель не нужна — не перебираем врагов
+      if (tower.cooldown > 0) {
+        return;
+      }
+      if (targetCount < 0) {
+        targetCount = this.collectTargetSnapshot();
+      }
+      const target = this.findTargetForTower(tower, targetCount);
       if (!target) {
         return;
       }
 
-      if (tower.cooldown <= 0) {
-        this.fireProjectile(tower, target);
-        const rate = Phaser.Math.Clamp(tower.definition.fireRate, 0.25, 6);
-        tower.cooldown = 1000 / rate;
-      }
+      this.fireProjectile(tower, target);
+      tower.cooldown = tower.reloadMs;
     });
 
-    this.projectiles.getChildren().forEach((child) => {
+    // Границы мира и текущее время одинаковы для всех снарядов в кадре
+    const now = this.time.now;
+    const maxX = this.physics.world.bounds.width + 80;
+    const maxY = this.physics.world.bounds.height + 80;
+    // Копия списка: destroy удаляет снаряд из группы во время обхода
+    this.projectiles.getChildren().slice().forEach((child) => {
       const projectile = child as Phaser.Physics.Arcade.Image;
       const expiresAt = projectile.getData('expiresAt') as number | undefined;
-      if (expiresAt && expiresAt < this.time.now) {
+      if (expiresAt && expiresAt < now) {
         projectile.destroy();
         return;
       }
 
-      if (
-        projectile.x < -80 ||
-        projectile.x > this.physics.world.bounds.width + 80 ||
-        projectile.y < -80 ||
-        projectile.y > this.physics.world.bounds.height + 80
-      ) {
+      if (projectile.x < -80 || projectile.x > maxX || projectile.y < -80 || projectile.y > maxY) {
         projectile.destroy();
       }
     });
 
+    this.refreshCreditsText();
     this.tryCompleteGame();
   }
 
@@ -178,11 +217,10 @@ export class TowerDefenseScene extends BaseGameScene {
 
     this.physics.world.setBounds(0, 0, width, height);
     this.cameras.main.setBounds(0, 0, width, height);
+    // Фон заливает сама камера, а дорога запекается в одну текстуру в drawPath —
+    // отдельный полноэкранный прямоугольник того же цвета только добавлял лишнюю заливку кадра
     this.cameras.main.setBackgroundColor(this.theme.background);
 
-    const background = this.add.rectangle(width / 2, height / 2, width, height, this.theme.background, 1);
-    background.setDepth(-5);
-
     this.pathPoints = this.createPath(width, height);
     this.drawPath();
     this.createTowerSlots();
@@ -262,6 +300,8 @@ export class TowerDefenseScene extends BaseGameScene {
       sprite,
       label,
       cooldown: 0,
+      // Перезарядка зависит только от определения башни — считаем её один раз при постройке
+      reloadMs: 1000 / Phaser.Math.Clamp(definition.fireRate, 0.25, 6),
     };
   }
 
@@ -270,40 +310,29 @@ export class TowerDefenseScene extends BaseGameScene {
       return;
     }
 
-    if (this.wavesStarted >= this.waveDefinitions.length) {
-      this.allWavesScheduled = true;
-      return;
-    }
-
-    const wave = this.waveDefinitions[this.wavesStarted];
-    this.wavesStarted += 1;
-    this.waveText.setText(`Волна ${this.wavesStarted}/${this.waveDefinitions.length}: ${wave.name}`);
-
-    const plan: EnemyDefinition[] = [];
-    wave.groups.forEach((group) => {
-      const enemy = this.enemyMap.get(group.enemyId);
-      if (!enemy) return;
-      const count = Phaser.Math.Clamp(group.count, 1, 15);
-      for (let i = 0; i < count; i++) {
-        plan.push(enemy);
+    // Волны без известных врагов пропускаем в цикле, а не рекурсивным вызовом spawnNextWave
+    let plan: EnemySpawnStats[] = [];
+    while (!plan.length) {
+      if (this.wavesStarted >= this.waveDefinitions.length) {
+        this.allWavesScheduled = true;
+        return;
       }
-    });
 
-    if (!plan.length) {
-      this.spawnNextWave();
-      return;
+      const wave = this.waveDefinitions[this.wavesStarted];
+      this.wavesStarted += 1;
+      this.waveText.setText(`Волна ${this.wavesStarted}/${this.waveDefinitions.length}: ${wave.name}`);
+      plan = this.buildWaveSpawnPlan(wave, this.wavesStarted - 1);
     }
 
     let spawnIndex = 0;
     const baseDelay = Phaser.Math.Clamp(900 - plan.length * 15, 450, 1100);
     const timeScale = this.getGlobalTimeScale(1);
     const spawnDelay = baseDelay / timeScale;
-    const waveIndex = this.wavesStarted - 1;
     let spawner: Phaser.Time.TimerEvent | null = null;
 
     const finalizeWaveSchedule = () => {
       if (spawner) {
-        this.activeSpawners = this.activeSpawners.filter((event) => event !== spawner);
+        this.activeSpawners.delete(spawner);
       }
       if (this.wavesStarted >= this.waveDefinitions.length) {
         this.allWavesScheduled = true;
@@ -312,7 +341,7 @@ export class TowerDefenseScene extends BaseGameScene {
       }
     };
 
-    this.spawnEnemy(plan[spawnIndex], wave, waveIndex);
+    this.spawnEnemy(plan[spawnIndex]);
     spawnIndex += 1;
 
     if (plan.length === 1) {
@@ -330,7 +359,7 @@ export class TowerDefenseScene extends BaseGameScene {
           finalizeWaveSchedule();
           return;
         }
-        this.spawnEnemy(plan[spawnIndex], wave, waveIndex);
+        this.spawnEnemy(plan[spawnIndex]);
         spawnIndex += 1;
         if (spawnIndex >= plan.length) {
           spawner?.remove(false);
@@ -339,16 +368,44 @@ export class TowerDefenseScene extends BaseGameScene {
       },
     });
 
-    this.activeSpawners.push(spawner);
+    this.activeSpawners.add(spawner);
   }
 
-  private spawnEnemy(definition: EnemyDefinition, wave: WaveDefinition, waveIndex: number): void {
+  private buildWaveSpawnPlan(wave: WaveDefinition, waveIndex: number): EnemySpawnStats[] {
+    const speedMultiplier = this.getDifficultyMultiplier(this.gameData.difficulty) * this.getGlobalTimeScale(1);
+    const healthMultiplier = 1 + waveIndex * 0.15;
+    const rewardMultiplier = wave.rewardMultiplier || 1;
+
+    const plan: EnemySpawnStats[] = [];
+    wave.groups.forEach((group) => {
+      const definition = this.enemyMap.get(group.enemyId);
+      if (!definition) return;
+      const baseSpeed = Phaser.Math.Clamp(definition.speed, 40, 160);
+      const stats: EnemySpawnStats = {
+        definition,
+        health: Math.round(
+          this.normalizeNumber(definition.health, 120, 50, 400) * healthMultiplier * speedMultiplier,
+        ),
+        reward: Math.round(this.normalizeNumber(definition.reward, 15, 5, 80) * rewardMultiplier),
+        speed: Phaser.Math.Clamp(baseSpeed * (0.9 + waveIndex * 0.05), 40, 260),
+        llmRole: this.bossEnemyIds.has(definition.id) ? 'boss' : 'enemy',
+        llmTextureById: this.getLlmTextureKey({ id: definition.id }),
+      };
+      const count = Phaser.Math.Clamp(group.count, 1, 15);
+      for (let i = 0; i < count; i++) {
+        plan.push(stats);
+      }
+    });
+    return plan;
+  }
+
+  private spawnEnemy(stats: EnemySpawnStats): void {
+    const { definition } = stats;
     const startPoint = this.pathPoints[0];
-    const isBoss = definition.id?.toLowerCase().includes('boss');
-    const llmTexture =
-      this.getLlmTextureKey({ id: definition.id }) ??
-      this.getLlmTextureKey({ role: isBoss ? 'boss' : 'enemy', random: true });
-    const textureKey = llmTexture ?? this.ensureCircleTexture('enemy', 14, definition.color ?? this.theme.enemy);
+    const llmTexture = stats.llmTextureById ?? this.getLlmTextureKey({ role: stats.llmRole, random: true });
+    const textureKey =
+      llmTexture ??
+      (stats.fallbackTexture ??= this.ensureCircleTexture('enemy', 14, definition.color ?? this.theme.enemy));
     const enemy = this.physics.add.sprite(startPoint.x, startPoint.y, textureKey);
     enemy.setDepth(2);
     if (llmTexture) {
@@ -359,19 +416,10 @@ export class TowerDefenseScene extends BaseGameScene {
     enemy.setCollideWorldBounds(false);
     this.disableGravity(enemy);
 
-    const speedMultiplier = this.getDifficultyMultiplier(this.gameData.difficulty) * this.getGlobalTimeScale(1);
-    const baseSpeed = Phaser.Math.Clamp(definition.speed, 40, 160);
-    const healthMultiplier = 1 + waveIndex * 0.15;
-    const rewardMultiplier = wave.rewardMultiplier || 1;
-
-    const health = Math.round(this.normalizeNumber(definition.health, 120, 50, 400) * healthMultiplier * speedMultiplier);
-    const reward = Math.round(this.normalizeNumber(definition.reward, 15, 5, 80) * rewardMultiplier);
-    const speed = Phaser.Math.Clamp(baseSpeed * (0.9 + waveIndex * 0.05), 40, 260);
-
-    enemy.setData('hp', health);
-    enemy.setData('maxHp', health);
-    enemy.setData('speed', speed);
-    enemy.setData('reward', reward);
+    enemy.setData('hp', stats.health);
+    enemy.setData('maxHp', stats.health);
+    enemy.setData('speed', stats.speed);
+    enemy.setData('reward', stats.reward);
     enemy.setData('pathIndex', 0);
     enemy.setData('definitionId', definition.id);
 
@@ -379,7 +427,9 @@ export class TowerDefenseScene extends BaseGameScene {
   }
 
   private advanceEnemy(enemy: Phaser.Physics.Arcade.Sprite): void {
-    let pathIndex = (enemy.getData('pathIndex') as number) ?? 0;
+    // Поля врага читаем напрямую из списка DataManager, без getData на каждое поле каждый кадр
+    const data = enemy.data.list as { pathIndex?: number; speed?: number };
+    const pathIndex = data.pathIndex ?? 0;
     const nextPoint = this.pathPoints[pathIndex + 1];
 
     if (!nextPoint) {
@@ -389,34 +439,83 @@ export class TowerDefenseScene extends BaseGameScene {
 
     const distance = Phaser.Math.Distance.Between(enemy.x, enemy.y, nextPoint.x, nextPoint.y);
     if (distance < 6) {
-      pathIndex += 1;
-      enemy.setData('pathIndex', pathIndex);
+      enemy.setData('pathIndex', pathIndex + 1);
       return;
     }
 
-    const speed = (enemy.getData('speed') as number) || 60;
+    const speed = data.speed || 60;
     const vx = ((nextPoint.x - enemy.x) / distance) * speed;
     const vy = ((nextPoint.y - enemy.y) / distance) * speed;
     enemy.setVelocity(vx, vy);
   }
 
-  private findTargetForTower(tower: TowerInstance): Phaser.Physics.Arcade.Sprite | null {
-    const range = tower.definition.range;
-    let best: Phaser.Physics.Arcade.Sprite | null = null;
-    let bestProgress = -1;
+  private collectTargetSnapshot(): number {
+    const bounds = this.physics.world.bounds;
+    const cols = Math.max(1, Math.ceil(bounds.width / this.targetCellSize));
+    const rows = Math.max(1, Math.ceil(bounds.height / this.targetCellSize));
+    if (this.targetCellHead.length !== cols * rows) {
+      this.targetCellHead = new Int32Array(cols * rows);
+    }
+    this.targetCellCols = cols;
+    this.targetCellRows = rows;
+    this.targetCellHead.fill(-1);
 
+    let count = 0;
     this.enemies.getChildren().forEach((child) => {
       const enemy = child as Phaser.Physics.Arcade.Sprite;
-      const distance = Phaser.Math.Distance.Between(tower.position.x, tower.position.y, enemy.x, enemy.y);
-      if (distance > range) return;
-      const progress = (enemy.getData('pathIndex') as number) ?? 0;
-      if (!best || progress > bestProgress) {
-        best = enemy;
-        bestProgress = progress;
-      }
+      this.targetEnemies[count] = enemy;
+      this.targetXs[count] = enemy.x;
+      this.targetYs[count] = enemy.y;
+      this.targetProgress[count] = (enemy.getData('pathIndex') as number) ?? 0;
+      // Враги за краем мира попадают в крайние клетки — радиус башни у края их всё равно захватит
+      const col = Phaser.Math.Clamp(Math.floor(enemy.x / this.targetCellSize), 0, cols - 1);
+      const row = Phaser.Math.Clamp(Math.floor(enemy.y / this.targetCellSize), 0, rows - 1);
+      const cell = row * cols + col;
+      this.targetNextInCell[count] = this.targetCellHead[cell];
+      this.targetCellHead[cell] = count;
+      count++;
     });
+    // Не держим ссылки на уничтоженных врагов из прошлых кадров
+    this.targetEnemies.length = count;
+    return count;
+  }
+
+  private findTargetForTower(tower: TowerInstance, targetCount: number): Phaser.Physics.Arcade.Sprite | null {
+    // Для попадания в радиус достаточно квадрата расстояния — корень не нужен
+    const range = tower.definition.range;
+    const rangeSq = range * range;
+    const towerX = tower.position.x;
+    const towerY = tower.position.y;
+    if (targetCount === 0) {
+      return null;
+    }
+    let bestIndex = -1;
+    let bestProgress = -1;
 
-    return best;
+    const size = this.targetCellSize;
+    const cols = this.targetCellCols;
+    const minCol = Phaser.Math.Clamp(Math.floor((towerX - range) / size), 0, cols - 1);
+    const maxCol = Phaser.Math.Clamp(Math.floor((towerX + range) / size), 0, cols - 1);
+    const minRow = Phaser.Math.Clamp(Math.floor((towerY - range) / size), 0, this.targetCellRows - 1);
+    const maxRow = Phaser.Math.Clamp(Math.floor((towerY + range) / size), 0, this.targetCellRows - 1);
+
+    for (let row = minRow; row <= maxRow; row++) {
+      for (let col = minCol; col <= maxCol; col++) {
+        for (let i = this.targetCellHead[row * cols + col]; i >= 0; i = this.targetNextInCell[i]) {
+          const dx = this.targetXs[i] - towerX;
+          const dy = this.targetYs[i] - towerY;
+          if (dx * dx + dy * dy > rangeSq) continue;
+          // При равном прогрессе побеждает враг, раньше попавший в снимок, как и при полном переборе
+          const progress = this.targetProgress[i];
+          if (bestIndex < 0 || progress > bestProgress || (progress === bestProgress && i < bestIndex)) {
+            bestIndex = i;
+            bestProgress = progress;
+          }
+        }
+      }
+    }
+
+    return bestIndex >= 0 ? this.targetEnemies[bestIndex] : null;
   }
 
   private fireProjectile(tower: TowerInstance, target: Phaser.Physics.Arcade.Sprite): void {
@@ -453,7 +552,7 @@ export class TowerDefenseScene extends BaseGameScene {
     const damage = (projectile.getData('damage') as number) || 5;
     projectile.destroy();
 
-    const currentHp = ((target.getData('hp') as number) || 0) - damage;
+    const currentHp = Math.max(0, ((target.getData('hp') as number) || 0) - damage);
     target.setData('hp', currentHp);
 
     if (currentHp <= 0) {
@@ -464,12 +563,20 @@ export class TowerDefenseScene extends BaseGameScene {
   private handleEnemyDestroyed(enemy: Phaser.Physics.Arcade.Sprite): void {
     const reward = (enemy.getData('reward') as number) || 10;
     this.credits += reward;
-    this.creditsText.setText(`Энергия: ${this.credits}`);
     this.updateScore(reward);
 
     enemy.destroy();
   }
 
+  // Несколько убийств за кадр дают одну перерисовку подписи, а не по одной на каждое
+  private refreshCreditsText(): void {
+    if (this.credits === this.renderedCredits) {
+      return;
+    }
+    this.renderedCredits = this.credits;
+    this.creditsText.setText(`Энергия: ${this.credits}`);
+  }
+
   private handleBaseBreach(enemy: Phaser.Physics.Arcade.Sprite): void {
     enemy.destroy();
     this.baseHealth -= 1;
@@ -485,7 +592,7 @@ export class TowerDefenseScene extends BaseGameScene {
       return;
     }
 
-    if (this.activeSpawners.length > 0) {
+    if (this.activeSpawners.size > 0) {
       return;
     }
 
@@ -512,7 +619,7 @@ export class TowerDefenseScene extends BaseGameScene {
   private stopSpawners(): void {
     this.waveTimer?.remove(false);
     this.activeSpawners.forEach((event) => event.remove(false));
-    this.activeSpawners = [];
+    this.activeSpawners.clear();
   }
 
   private createPath(width: number, height: number): Phaser.Math.Vector2[] {
@@ -535,8 +642,9 @@ export class TowerDefenseScene extends BaseGameScene {
       return;
     }
 
-    const graphics = this.add.graphics();
-    graphics.setDepth(-1);
+    // Дорога статична: рисуем её один раз в текстуру размером с мир и показываем одной картинкой,
+    // а не пересобираем толстые линии Graphics каждый кадр
+    const graphics = this.make.graphics({ x: 0, y: 0, add: false } as Phaser.Types.GameObjects.Graphics.Options);
 
     const path = new Phaser.Curves.Path(this.pathPoints[0].x, this.pathPoints[0].y);
     for (let i = 1; i < this.pathPoints.length; i++) {
@@ -547,6 +655,16 @@ export class TowerDefenseScene extends BaseGameScene {
     path.draw(graphics);
     graphics.lineStyle(22, this.theme.path, 0.9);
     path.draw(graphics);
+
+    const textureKey = 'td_path';
+    if (this.textures.exists(textureKey)) {
+      this.textures.remove(textureKey);
+    }
+    const bounds = this.physics.world.bounds;
+    graphics.generateTexture(textureKey, bounds.width, bounds.height);
+    graphics.destroy();
+
+    this.add.image(0, 0, textureKey).setOrigin(0, 0).setDepth(-1);
   }
 
   private createTowerSlots(): void {
@@ -580,19 +698,20 @@ export class TowerDefenseScene extends BaseGameScene {
     this.towerSlots = slots;
   }
 
-  private extractTowerDefinitions(): TowerDefinition[] {
-    const fallback = this.getFallbackTowers();
+  // Проверки payload и mechanics общие для всех экстракторов — делаем их один раз в initGame
+  private getMechanicsRecord(): Record<string, unknown> | undefined {
     const payload = this.gameData.gameData as GeneratedGameData | undefined;
     if (!payload || typeof payload !== 'object') {
-      return fallback;
+      return undefined;
     }
 
     const mechanics = payload.mechanics as Record<string, unknown> | undefined;
-    if (!mechanics || typeof mechanics !== 'object') {
-      return fallback;
-    }
+    return mechanics && typeof mechanics === 'object' ? mechanics : undefined;
+  }
 
-    const raw = mechanics.towerTypes;
+  private extractTowerDefinitions(mechanics: Record<string, unknown> | undefined): TowerDefinition[] {
+    const fallback = this.getFallbackTowers();
+    const raw = mechanics?.towerTypes;
     if (!Array.isArray(raw)) {
       return fallback;
     }
@@ -631,60 +750,44 @@ export class TowerDefenseScene extends BaseGameScene {
     return parsed.length ? parsed : fallback;
   }
 
-  private extractEnemyDefinitions(): Map<string, EnemyDefinition> {
+  private extractEnemyDefinitions(mechanics: Record<string, unknown> | undefined): Map<string, EnemyDefinition> {
     const fallback = this.getFallbackEnemies();
-    const payload = this.gameData.gameData as GeneratedGameData | undefined;
-
-    if (!payload || typeof payload !== 'object') {
-      return fallback;
-    }
-
-    const mechanics = payload.mechanics as Record<string, unknown> | undefined;
-    if (!mechanics || typeof mechanics !== 'object') {
-      return fallback;
-    }
-
-    const raw = mechanics.enemyTypes;
+    const raw = mechanics?.enemyTypes;
     if (!Array.isArray(raw)) {
       return fallback;
     }
 
-    const parsed = raw
-      .map<EnemyDefinition | null>((item, index) => {
-        if (!item || typeof item !== 'object') return null;
-        const data = item as Record<string, unknown>;
-        const id = String(data.id ?? `enemy-${index}`);
-        const name = typeof data.name === 'string' ? data.name : `Враг ${index + 1}`;
-        const speed = this.normalizeNumber(data.speed, 80, 30, 200);
-        const health = this.normalizeNumber(data.health, 100, 40, 400);
-        const reward = this.normalizeNumber(data.reward, 12, 5, 60);
-        const ability = typeof data.ability === 'string' ? data.ability : undefined;
-        const color = this.parseColor(data.color, this.theme.enemy);
-
-        return {
-          id,
-          name,
-          speed,
-          health,
-          reward,
-          ability,
-          color,
-        };
-      })
-      .filter((enemy): enemy is EnemyDefinition => !!enemy);
-
-    if (!parsed.length) {
-      return fallback;
-    }
+    // Определения кладём прямо в Map одним проходом, без промежуточных массивов map/filter и пар [id, enemy]
+    const parsed = new Map<string, EnemyDefinition>();
+    raw.forEach((item, index) => {
+      if (!item || typeof item !== 'object') return;
+      const data = item as Record<string, unknown>;
+      const id = String(data.id ?? `enemy-${index}`);
+      const name = typeof data.name === 'string' ? data.name : `Враг ${index + 1}`;
+      const speed = this.normalizeNumber(data.speed, 80, 30, 200);
+      const health = this.normalizeNumber(data.health, 100, 40, 400);
+      const reward = this.normalizeNumber(data.reward, 12, 5, 60);
+      const ability = typeof data.ability === 'string' ? data.ability : undefined;
+      const color = this.parseColor(data.color, this.theme.enemy);
+
+      parsed.set(id, {
+        id,
+        name,
+        speed,
+        health,
+        reward,
+        ability,
+        color,
+      });
+    });
 
-    return new Map(parsed.map((enemy) => [enemy.id, enemy]));
+    return parsed.size ? parsed : fallback;
   }
 
-  private extractWaveDefinitions(): WaveDefinition[] {
+  private extractWaveDefinitions(mechanics: Record<string, unknown> | undefined): WaveDefinition[] {
     const fallback = this.getFallbackWaves();
     const payload = this.gameData.gameData as GeneratedGameData | undefined;
 
-    const mechanics = payload?.mechanics as Record<string, unknown> | undefined;
     const candidate = (mechanics?.waves as unknown) ?? payload?.levels;
 
     const parsed = this.parseWaves(candidate) ?? fallback;
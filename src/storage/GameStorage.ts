@@ -77,10 +77,5 @@ export class GameStorage {
 
     await this.saveGame(game);
   }
-
-  static async getTotalRewards(): Promise<number> {
-    const games = await this.getAllGames();
-    return games.reduce((sum, game) => sum + game.rewards, 0);
-  }
 }
 
@@ -175,7 +175,9 @@ export const gameTemplates: GameTemplateDefinition[] = [
   },
 ];
 
+const templatesById = new Map<GameTemplate, GameTemplateDefinition>(gameTemplates.map((t) => [t.id, t]));
+
 export function getTemplateById(id: GameTemplate): GameTemplateDefinition | undefined {
-  return gameTemplates.find((t) => t.id === id);
+  return templatesById.get(id);
 }
 
@@ -1,8 +1,47 @@
 import type { GeneratedGame, GameTemplate, Difficulty, GameConfig } from '@/types';
 import { GameStorage } from '@/storage/GameStorage';
-import { gameTemplates } from '@/templates';
+import { gameTemplates, getTemplateById } from '@/templates';
 import { ChatGPTAPI } from '@/api/chatgpt';
 
+const DIFFICULTY_NAMES: Record<Difficulty, string> = {
+  easy: 'Легкая',
+  medium: 'Средняя',
+  hard: 'Сложная',
+};
+
+// Разметка панели генератора не зависит от состояния экрана — собираем её один раз при загрузке модуля
+const GENERATOR_PANEL_HTML = `
+  <h2>Создать новую игру</h2>
+  
+  <div class="form-group">
+    <label>Шаблон игры</label>
+    <select id="template-select" class="form-control">
+      ${gameTemplates.map((t) => `<option value="${t.id}">${t.name}</option>`).join('')}
+    </select>
+  </div>
+
+  <div class="form-group">
+    <label>Сложность</label>
+    <select id="difficulty-select" class="form-control">
+      <option value="easy">Легкая</option>
+      <option value="medium" selected>Средняя</option>
+      <option value="hard">Сложная</option>
+    </select>
+  </div>
+
+  <div id="params-container" class="params-container"></div>
+
+  <button id="generate-btn" class="generate-btn">🎲 Сгенерировать игру</button>
+  <div id="generation-status" class="generation-status"></div>
+  <div id="sprite-loader" class="sprite-loader" aria-live="polite">
+    <div class="spinner" aria-hidden="true"></div>
+    <div class="sprite-loader-text">
+      <strong>Генерация спрайтов...</strong>
+      <p id="sprite-loader-text">Формируем 16-битный набор героев и врагов</p>
+    </div>
+  </div>
+`;
+
 export class MainScreen {
   private container: HTMLElement;
   private games: GeneratedGame[] = [];
@@ -18,8 +57,8 @@ export class MainScreen {
       this.container.classList.remove('game-mode');
     }
     this.chatGPTAPI = new ChatGPTAPI();
-    this.loadGames().then(async () => {
-      await this.render();
+    this.loadGames().then(() => {
+      this.render();
     });
   }
 
@@ -27,15 +66,14 @@ export class MainScreen {
     this.games = await GameStorage.getAllGames();
   }
 
-  private async render(): Promise<void> {
+  private render(): void {
     this.container.innerHTML = '';
 
     const header = document.createElement('div');
     header.className = 'header';
-    const totalRewards = await GameStorage.getTotalRewards();
     header.innerHTML = `
       <h1>🎮 Game Generator</h1>
-      <div class="rewards">Награды: ${totalRewards}</div>
+      <div class="rewards">Награды: ${this.getTotalRewards()}</div>
     `;
 
     const content = document.createElement('div');
@@ -69,10 +107,8 @@ export class MainScreen {
       empty.textContent = 'Пока нет игр. Создайте новую!';
       list.appendChild(empty);
     } else {
-      this.games.forEach((game) => {
-        const card = this.createGameCard(game);
-        list.appendChild(card);
-      });
+      // Разметку всех карточек собираем в одну строку и разбираем за один проход парсера
+      list.innerHTML = this.games.map((game) => this.renderGameCard(game)).join('');
     }
 
     section.appendChild(title);
@@ -81,65 +117,33 @@ export class MainScreen {
     return section;
   }
 
-  private createGameCard(game: GeneratedGame): HTMLElement {
-    const card = document.createElement('div');
-    card.className = 'game-card';
-    card.innerHTML = `
-      <div class="game-card-header">
-        <h3>${game.title}</h3>
-        <button class="delete-btn" data-id="${game.id}">✕</button>
-      </div>
-      <div class="game-card-body">
-        <div class="game-info">
-          <span class="template-badge">${this.getTemplateName(game.template)}</span>
-          <span class="difficulty-badge ${game.difficulty}">${this.getDifficultyName(game.difficulty)}</span>
+  private renderGameCard(game: GeneratedGame): string {
+    return `
+      <div class="game-card">
+        <div class="game-card-header">
+          <h3>${game.title}</h3>
+          <button class="delete-btn" data-id="${game.id}">✕</button>
         </div>
-        <div class="game-stats">
-          <div>Рекорд: ${game.highScore}</div>
-          <div>Награды: ${game.rewards}</div>
+        <div class="game-card-body">
+          <div class="game-info">
+            <span class="template-badge">${this.getTemplateName(game.template)}</span>
+            <span class="difficulty-badge ${game.difficulty}">${this.getDifficultyName(game.difficulty)}</span>
+          </div>
+          <div class="game-stats">
+            <div>Рекорд: ${game.highScore}</div>
+            <div>Награды: ${game.rewards}</div>
+          </div>
         </div>
+        <button class="play-btn" data-id="${game.id}">Играть</button>
       </div>
-      <button class="play-btn" data-id="${game.id}">Играть</button>
     `;
-
-    return card;
   }
 
   private createGeneratorPanel(): HTMLElement {
     const panel = document.createElement('div');
     panel.className = 'generator-panel';
 
-    panel.innerHTML = `
-      <h2>Создать новую игру</h2>
-      
-      <div class="form-group">
-        <label>Шаблон игры</label>
-        <select id="template-select" class="form-control">
-          ${gameTemplates.map((t) => `<option value="${t.id}">${t.name}</option>`).join('')}
-        </select>
-      </div>
-
-      <div class="form-group">
-        <label>Сложность</label>
-        <select id="difficulty-select" class="form-control">
-          <option value="easy">Легкая</option>
-          <option value="medium" selected>Средняя</option>
-          <option value="hard">Сложная</option>
-        </select>
-      </div>
-
-      <div id="params-container" class="params-container"></div>
-
-      <button id="generate-btn" class="generate-btn">🎲 Сгенерировать игру</button>
-      <div id="generation-status" class="generation-status"></div>
-      <div id="sprite-loader" class="sprite-loader" aria-live="polite">
-        <div class="spinner" aria-hidden="true"></div>
-        <div class="sprite-loader-text">
-          <strong>Генерация спрайтов...</strong>
-          <p id="sprite-loader-text">Формируем 16-битный набор героев и врагов</p>
-        </div>
-      </div>
-    `;
+    panel.innerHTML = GENERATOR_PANEL_HTML;
 
     return panel;
   }
@@ -157,8 +161,15 @@ export class MainScreen {
       this.generateGame();
     });
 
+    this.attachGameCardListeners(this.container);
+
+    // Инициализация полей параметров
+    this.updateParamsFields();
+  }
+
+  private attachGameCardListeners(root: HTMLElement): void {
     // Удаление игры
-    this.container.querySelectorAll('.delete-btn').forEach((btn) => {
+    root.querySelectorAll('.delete-btn').forEach((btn) => {
       btn.addEventListener('click', (e) => {
         const id = (e.target as HTMLElement).dataset.id;
         if (id) {
@@ -168,7 +179,7 @@ export class MainScreen {
     });
 
     // Запуск игры
-    this.container.querySelectorAll('.play-btn').forEach((btn) => {
+    root.querySelectorAll('.play-btn').forEach((btn) => {
       btn.addEventListener('click', (e) => {
         const id = (e.target as HTMLElement).dataset.id;
         if (id) {
@@ -176,9 +187,23 @@ export class MainScreen {
         }
       });
     });
+  }
 
-    // Инициализация полей параметров
-    this.updateParamsFields();
+  // Обновляет только список игр и счётчик наград, не трогая панель генератора с введёнными параметрами
+  private refreshGamesSection(): void {
+    const updated = this.createGamesList();
+    this.container.querySelector('.games-section')?.replaceWith(updated);
+    this.attachGameCardListeners(updated);
+
+    const rewards = this.container.querySelector('.rewards');
+    if (rewards) {
+      rewards.textContent = `Награды: ${this.getTotalRewards()}`;
+    }
+  }
+
+  private getTotalRewards(): number {
+    // Игры уже загружены в loadGames, считаем награды по ним без повторного запроса всего списка
+    return this.games.reduce((sum, game) => sum + game.rewards, 0);
   }
 
   private updateParamsFields(): void {
@@ -187,11 +212,12 @@ export class MainScreen {
     if (!templateSelect || !paramsContainer) return;
 
     const templateId = templateSelect.value as GameTemplate;
-    const template = gameTemplates.find((t) => t.id === templateId);
+    const template = getTemplateById(templateId);
 
     if (!template) return;
 
-    paramsContainer.innerHTML = '';
+    // Собираем все поля во фрагменте и вставляем в документ одной операцией
+    const fields = document.createDocumentFragment();
 
     template.paramFields.forEach((field) => {
       const group = document.createElement('div');
@@ -211,7 +237,7 @@ export class MainScreen {
         label.setAttribute('for', checkbox.id);
         group.appendChild(checkbox);
         group.appendChild(label);
-        paramsContainer.appendChild(group);
+        fields.appendChild(group);
         return;
       }
 
@@ -247,8 +273,10 @@ export class MainScreen {
 
       group.appendChild(label);
       group.appendChild(input);
-      paramsContainer.appendChild(group);
+      fields.appendChild(group);
     });
+
+    paramsContainer.replaceChildren(fields);
   }
 
   private async generateGame(): Promise<void> {
@@ -265,7 +293,7 @@ export class MainScreen {
     const difficulty = difficultySelect.value as Difficulty;
 
     // Собираем параметры
-    const templateDef = gameTemplates.find((t) => t.id === template);
+    const templateDef = getTemplateById(template);
     if (!templateDef) return;
 
     const params: Record<string, unknown> = {};
@@ -333,7 +361,7 @@ export class MainScreen {
 
       await GameStorage.saveGame(game);
       await this.loadGames();
-      await this.render();
+      this.render();
 
       if (statusDiv) {
         const hasAssets = Boolean(gameData?.assets?.spriteKit);
@@ -364,8 +392,8 @@ export class MainScreen {
   private async deleteGame(id: string): Promise<void> {
     if (confirm('Удалить эту игру?')) {
       await GameStorage.deleteGame(id);
-      await this.loadGames();
-      await this.render();
+      this.games = this.games.filter((game) => game.id !== id);
+      this.refreshGamesSection();
     }
   }
 
@@ -379,16 +407,11 @@ export class MainScreen {
   }
 
   private getTemplateName(template: GameTemplate): string {
-    return gameTemplates.find((t) => t.id === template)?.name || template;
+    return getTemplateById(template)?.name || template;
   }
 
   private getDifficultyName(difficulty: Difficulty): string {
-    const names: Record<Difficulty, string> = {
-      easy: 'Легкая',
-      medium: 'Средняя',
-      hard: 'Сложная',
-    };
-    return names[difficulty] || difficulty;
+    return DIFFICULTY_NAMES[difficulty] || difficulty;
   }
 }
 
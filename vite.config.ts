@@ -14,6 +14,12 @@ export default defineConfig({
   build: {
     target: 'esnext',
     minify: 'terser',
+    terserOptions: {
+      compress: {
+        // Отладочные трассы генерации спрайтов нужны только в dev — в продакшен-бандл не попадают
+        pure_funcs: ['console.debug'],
+      },
+    },
     rollupOptions: {
       output: {
         manualChunks: {